@@ -1,6 +1,5 @@
 import React, { useState, useEffect, Suspense } from 'react';
 import { ErrorBoundary } from './components/ErrorBoundary';
-import { DebugPanel } from './components/DebugPanel';
 import { Layout } from './components/Layout';
 import { PwaUpdatePrompt } from './components/PwaUpdatePrompt';
 import { PageView, AppMode, NavParams } from './types';
@@ -113,6 +112,8 @@ const Products = React.lazy(loadProducts);
 const BuildHub = React.lazy(loadBuildHub);
 // Livv Quote OS — self-contained quoting surface, mounted at ?app=quoting
 const QuoteOS = React.lazy(() => import('./components/quoting/QuoteOS'));
+// Dev-only overlay (Ctrl+D) — kept out of the entry chunk.
+const DebugPanel = React.lazy(() => import('./components/DebugPanel').then(m => ({ default: m.DebugPanel })));
 
 const scheduleIdle = (callback: () => void) => {
   if (typeof window === 'undefined') return;
@@ -1169,10 +1170,12 @@ const App: React.FC = () => {
     };
   }, [isInvite]);
 
-  // Detectar tecla D para debug (only in development)
+  // Detectar tecla D para debug (only in development). Production builds
+  // never register the listener, so keystrokes don't go through it at all.
   useEffect(() => {
+    if (process.env.NODE_ENV !== 'development') return;
     const handleKeyPress = (e: KeyboardEvent) => {
-      if (e.ctrlKey && e.key === 'd' && process.env.NODE_ENV === 'development') {
+      if (e.ctrlKey && e.key === 'd') {
         setShowDebug(prev => !prev);
       }
     };
@@ -1390,7 +1393,9 @@ const App: React.FC = () => {
                                   {/* Aurora multi-agent FAB — persistent across all admin pages */}
                                   <AuroraFab />
                                   {showDebug && (
-                                    <DebugPanel visible={showDebug} />
+                                    <Suspense fallback={null}>
+                                      <DebugPanel visible={showDebug} />
+                                    </Suspense>
                                   )}
                                 </AuroraProvider>
                               </SystemProvider>
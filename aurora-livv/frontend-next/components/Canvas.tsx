@@ -185,7 +185,8 @@ function Interactive({ canvas, onConfirm }: { canvas: CanvasShape; onConfirm?: (
 function Route({ canvas }: { canvas: CanvasShape }) {
   return (
     <div style={{ fontSize: 12, color: 'var(--text-muted)' }}>
-      Routing → {canvas.target_agent} <span style={{ fontStyle: 'italic' }}>· {canvas.reason}</span>
+      Routing → {canvas.target_agent}
+      {canvas.reason && <span style={{ fontStyle: 'italic' }}> · {canvas.reason}</span>}
     </div>
   );
 }
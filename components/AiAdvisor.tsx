@@ -40,14 +40,16 @@ import type { MarkdownAction } from '../lib/markdown';
 // Memory layer — every AiAdvisor turn lands in agent_conversations so
 // the critique loop sees it alongside Brief/orchestrator turns. The
 // user profile is injected into context so style/length preferences
-// learned elsewhere also apply here.
+// learned elsewhere also apply here. Imported from the leaf module, not
+// the lib/agents barrel: Layout mounts this eagerly, and the barrel
+// re-exports the orchestrator (every agent, skill and prompt).
 import {
   getUserProfile,
   formatProfileForPrompt,
   recordFeedback,
   logConversationTurn,
   type UserProfile,
-} from '../lib/agents';
+} from '../lib/agents/memory';
 
 const AREA_CONFIG: Record<string, { gradient: string; iconBg: string; border: string }> = {
   projects: { gradient: 'from-blue-500/8 to-transparent', iconBg: 'bg-blue-500/10 text-blue-600 dark:text-blue-400', border: 'border-blue-500/10' },
@@ -113,25 +113,77 @@ const typeLabel = (type: Notification['type']): string => {
 };
 
 // Small, self-contained "ding" using Web Audio — no dependency, no asset.
+// The sweep is identical every time, so it is rendered offline once into an
+// AudioBuffer; each ding after that is just a buffer-source playback.
+const DING_SECONDS = 0.4;
+const DING_SAMPLE_RATE = 44100;
+let dingBufferPromise: Promise<AudioBuffer> | null = null;
+// One output context, created on the first ding after a user gesture (before
+// that it would start suspended). Opening a context spins up an audio
+// device/thread, so it is reused and just suspended while no ding is playing.
+let dingContext: AudioContext | null = null;
+let dingsInFlight = 0;
+// Last suspend() issued on dingContext. It resolves asynchronously, so a new
+// ding resumes only after it — otherwise it could start on a context that
+// is still 'running' but about to suspend, play nothing and never end.
+let dingSuspend: Promise<void> = Promise.resolve();
+// How long a ding may wait for a suspended context to resume before it is
+// dropped, so blocked dings don't all fire at once later.
+const DING_RESUME_TIMEOUT_MS = 1000;
+
+function renderDing(): Promise<AudioBuffer> | null {
+  const Offline = (window as any).OfflineAudioContext || (window as any).webkitOfflineAudioContext;
+  if (!Offline) return null;
+  const ctx = new Offline(1, Math.ceil(DING_SECONDS * DING_SAMPLE_RATE), DING_SAMPLE_RATE);
+  const osc = ctx.createOscillator();
+  const gain = ctx.createGain();
+  osc.type = 'sine';
+  osc.frequency.setValueAtTime(880, 0);
+  osc.frequency.exponentialRampToValueAtTime(1320, 0.08);
+  gain.gain.setValueAtTime(0.0001, 0);
+  gain.gain.exponentialRampToValueAtTime(0.08, 0.03);
+  gain.gain.exponentialRampToValueAtTime(0.0001, 0.35);
+  osc.connect(gain);
+  gain.connect(ctx.destination);
+  osc.start(0);
+  osc.stop(DING_SECONDS);
+  return ctx.startRendering();
+}
+
 function playDing() {
   if (typeof window === 'undefined') return;
   try {
     const Ctx = (window as any).AudioContext || (window as any).webkitAudioContext;
     if (!Ctx) return;
-    const ctx = new Ctx();
-    const osc = ctx.createOscillator();
-    const gain = ctx.createGain();
-    osc.type = 'sine';
-    osc.frequency.setValueAtTime(880, ctx.currentTime);
-    osc.frequency.exponentialRampToValueAtTime(1320, ctx.currentTime + 0.08);
-    gain.gain.setValueAtTime(0.0001, ctx.currentTime);
-    gain.gain.exponentialRampToValueAtTime(0.08, ctx.currentTime + 0.03);
-    gain.gain.exponentialRampToValueAtTime(0.0001, ctx.currentTime + 0.35);
-    osc.connect(gain);
-    gain.connect(ctx.destination);
-    osc.start();
-    osc.stop(ctx.currentTime + 0.4);
-    setTimeout(() => ctx.close().catch(() => {}), 500);
+    if (!dingBufferPromise) {
+      dingBufferPromise = renderDing();
+      // Rendering unsupported or failed — forget it so the next ding retries.
+      dingBufferPromise?.catch(() => { dingBufferPromise = null; });
+    }
+    if (!dingBufferPromise) return;
+    // No gesture yet: a new context would start suspended and can't resume.
+    const activation = (navigator as any).userActivation;
+    if (!dingContext && activation && !activation.hasBeenActive) return;
+    if (!dingContext) dingContext = new Ctx() as AudioContext;
+    const ctx = dingContext;
+    const ready = dingSuspend.then(() => Promise.race([
+      ctx.resume(),
+      new Promise((_, reject) => setTimeout(() => reject(new Error('resume timeout')), DING_RESUME_TIMEOUT_MS)),
+    ]));
+    // Counted from now so another ding ending meanwhile doesn't suspend the
+    // context under this one.
+    dingsInFlight += 1;
+    const release = () => {
+      dingsInFlight -= 1;
+      if (dingsInFlight === 0) dingSuspend = ctx.suspend().catch(() => {});
+    };
+    Promise.all([dingBufferPromise, ready]).then(([buffer]) => {
+      const src = ctx.createBufferSource();
+      src.buffer = buffer;
+      src.connect(ctx.destination);
+      src.onended = release;
+      src.start();
+    }).catch(release); // autoplay blocked or resume timed out — silent
   } catch {
     // Autoplay blocked or unsupported — silent fall-through.
   }
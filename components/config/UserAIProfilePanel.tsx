@@ -27,12 +27,10 @@ import { Icons } from '../ui/Icons';
 import { useTenant } from '../../context/TenantContext';
 import { useAuth } from '../../hooks/useAuth';
 import { supabase } from '../../lib/supabase';
-import {
-  getUserProfile,
-  saveUserProfile,
-  runCritique,
-  type UserProfile,
-} from '../../lib/agents';
+// Leaf modules rather than the lib/agents barrel — this panel ships in the
+// boot bundle via Layout, and the barrel drags the orchestrator in with it.
+import { getUserProfile, saveUserProfile, type UserProfile } from '../../lib/agents/memory';
+import { runCritique } from '../../lib/agents/critique/critique-agent';
 
 const TONE_OPTIONS: { value: string; label: string }[] = [
   { value: 'friendly',  label: 'Friendly (default)' },
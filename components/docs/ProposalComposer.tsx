@@ -75,10 +75,12 @@ interface Props {
 const PROJECT_TYPES = ['web', 'branding', 'saas', 'ecommerce', 'automation', 'animation', 'content'];
 const COMPLEXITIES = ['simple', 'standard', 'advanced', 'complex'] as const;
 
-const detectLanguage = (text: string): 'en' | 'es' => {
-  const spanishHints = /(\b(el|la|los|las|que|para|con|una|este|esta|cliente|propuesta|entregables|necesito|queremos)\b)/i;
-  return spanishHints.test(text) ? 'es' : 'en';
-};
+// Compiled once at module load — a single case-insensitive scan per call,
+// no lowercased copy of the brief.
+const SPANISH_HINTS = /\b(?:el|la|los|las|que|para|con|una|este|esta|cliente|propuesta|entregables|necesito|queremos)\b/i;
+
+const detectLanguage = (text: string): 'en' | 'es' =>
+  SPANISH_HINTS.test(text) ? 'es' : 'en';
 
 // Heuristic: glance at the brief and guess a project_type so the user
 // rarely has to expand "Más opciones". Falls back to 'web'.
@@ -127,10 +127,11 @@ const PROJECT_TYPES = [
 
 const COMPLEXITIES = ['simple', 'standard', 'advanced', 'complex'];
 
-const detectLanguage = (text: string) => {
-  const spanishHints = /(\b(el|la|los|las|que|para|con|una|este|esta|cliente|propuesta|entregables)\b)/i;
-  return spanishHints.test(text) ? 'es' : 'en';
-};
+// Compiled once at module load — a single case-insensitive scan per call.
+const SPANISH_HINTS = /\b(?:el|la|los|las|que|para|con|una|este|esta|cliente|propuesta|entregables)\b/i;
+
+const detectLanguage = (text: string) =>
+  SPANISH_HINTS.test(text) ? 'es' : 'en';
 
 export const ProposalsPanel: React.FC = () => {
   const { currentTenant } = useTenant();
@@ -552,8 +552,8 @@ export const FinanceAssistant: React.FC<FinanceAssistantProps> = ({ isOpen, onCl
       return;
     }
     try {
-      const buf = await file.arrayBuffer();
-      const XLSX = await loadXLSX();
+      // Read the file while the xlsx chunk loads (first upload of a session).
+      const [buf, XLSX] = await Promise.all([file.arrayBuffer(), loadXLSX()]);
       const wb = XLSX.read(buf, { type: 'array', cellDates: true, cellNF: false, cellText: true });
       if (wb.SheetNames.length === 0) {
         setError('The file has no sheets.');
@@ -573,19 +573,23 @@ export const FinanceAssistant: React.FC<FinanceAssistantProps> = ({ isOpen, onCl
         const aoa: any[][] = XLSX.utils.sheet_to_json(sheet, { header: 1, blankrows: false, defval: '', raw: false });
         if (aoa.length === 0) continue;
         const headers = (aoa[0] || []).map((v, i) => String(v ?? '').trim() || `col${i + 1}`);
-        const dataRowsAll = aoa.slice(1);
-        if (dataRowsAll.length === 0) continue;
-
-        totalRowsAcrossWorkbook += dataRowsAll.length;
-        const dataRowsCapped = remainingBudget > 0 ? dataRowsAll.slice(0, remainingBudget) : [];
-        remainingBudget -= dataRowsCapped.length;
-
-        const rows: SheetRow[] = dataRowsCapped.map((row, idx) => {
+        // Data rows are aoa[1..]; index into it rather than copying the whole
+        // sheet twice (slice off the header, slice to the budget).
+        const dataRowCount = aoa.length - 1;
+        if (dataRowCount === 0) continue;
+
+        totalRowsAcrossWorkbook += dataRowCount;
+        const cappedCount = Math.min(dataRowCount, Math.max(remainingBudget, 0));
+        remainingBudget -= cappedCount;
+
+        const rows: SheetRow[] = new Array(cappedCount);
+        for (let idx = 0; idx < cappedCount; idx++) {
+          const row = aoa[idx + 1];
           const cells: Record<string, string> = {};
           headers.forEach((h, ci) => { cells[h] = String(row[ci] ?? '').trim(); });
-          return { source_sheet: sheetName, source_row: idx + 1, cells };
-        });
-        sheets.push({ name: sheetName, headers, rows, totalRows: dataRowsAll.length });
+          rows[idx] = { source_sheet: sheetName, source_row: idx + 1, cells };
+        }
+        sheets.push({ name: sheetName, headers, rows, totalRows: dataRowCount });
       }
 
       if (sheets.length === 0) {
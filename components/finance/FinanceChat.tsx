@@ -233,7 +233,8 @@ export const FinanceChat: React.FC<FinanceChatProps> = ({ isOpen, onClose, initi
         {
           query: question,
           forcedAgentId: 'finance-agent',
-          history: newHistory.slice(0, -1).map(m => ({ role: m.role, content: m.content })),
+          // Same 8-turn window as the other surfaces; the orchestrator never reads further back.
+          history: messages.slice(-8).map(m => ({ role: m.role, content: m.content })),
           surfaceHint: [
             'The user is inside the Finance copilot panel.',
             'Use the same universal assistant contract as every other AI surface: grounded facts, concise analysis, visible next action, and proposed actions only when a write is needed.',
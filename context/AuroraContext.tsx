@@ -10,7 +10,6 @@ import { auroraMockRespond } from '../lib/aurora/mockBackend';
 import { supabase } from '../lib/supabase';
 import { useTenant } from './TenantContext';
 import { useAuth } from '../hooks/useAuth';
-import { runOrchestrator } from '../lib/agents';
 
 type AuroraStatus = 'idle' | 'sending' | 'error';
 
@@ -187,6 +186,11 @@ export const AuroraProvider: React.FC<{ children: React.ReactNode }> = ({ childr
       const userId = user?.id;
       if (!tenantId || !userId) throw new Error('No tenant or user');
 
+      // The orchestrator pulls in every agent, skill and prompt. This provider
+      // mounts on every page, so load it on first send instead of at boot.
+      // Import the module itself: the lib/agents barrel would resolve to
+      // whatever chunk statically imports it and keep everything there.
+      const { runOrchestrator } = await import('../lib/agents/orchestrator');
       const out = await runOrchestrator(
         {
           query: trimmed,
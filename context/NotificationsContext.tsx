@@ -484,6 +484,31 @@ export const NotificationsProvider: React.FC<NotificationsProviderProps> = ({ ch
   useEffect(() => {
     if (!user || !currentTenant) return;
 
+    // "Mark all as read" or a bulk insert arrives as one event per row, each
+    // in its own socket message. Queue them and apply the whole batch in a
+    // single state update, instead of one list rewrite + render per row.
+    let pending: any[] = [];
+    let flushTimer: ReturnType<typeof setTimeout> | null = null;
+    const flush = () => {
+      flushTimer = null;
+      const batch = pending;
+      pending = [];
+      setNotifications((prev) => {
+        const inserted: Notification[] = [];
+        const updated = new Map<string, Notification>();
+        const deleted = new Set<string>();
+        for (const payload of batch) {
+          if (payload.eventType === 'INSERT') inserted.unshift(payload.new as Notification);
+          else if (payload.eventType === 'UPDATE') updated.set(payload.new.id, payload.new as Notification);
+          else if (payload.eventType === 'DELETE') deleted.add(payload.old.id);
+        }
+        let next = inserted.length > 0 ? [...inserted, ...prev] : prev;
+        if (updated.size > 0) next = next.map((n) => updated.get(n.id) ?? n);
+        if (deleted.size > 0) next = next.filter((n) => !deleted.has(n.id));
+        return next;
+      });
+    };
+
     const channel = supabase
       .channel(`notifications-${user.id}`)
       .on(
@@ -496,16 +521,8 @@ export const NotificationsProvider: React.FC<NotificationsProviderProps> = ({ ch
         },
         (payload) => {
           if (import.meta.env.DEV) console.log('Notification change:', payload.eventType);
-          
-          if (payload.eventType === 'INSERT') {
-            setNotifications((prev) => [payload.new as Notification, ...prev]);
-          } else if (payload.eventType === 'UPDATE') {
-            setNotifications((prev) =>
-              prev.map((n) => (n.id === payload.new.id ? (payload.new as Notification) : n))
-            );
-          } else if (payload.eventType === 'DELETE') {
-            setNotifications((prev) => prev.filter((n) => n.id !== payload.old.id));
-          }
+          pending.push(payload);
+          if (!flushTimer) flushTimer = setTimeout(flush, 50);
         }
       )
       .subscribe();
@@ -513,6 +530,7 @@ export const NotificationsProvider: React.FC<NotificationsProviderProps> = ({ ch
     setSubscription(channel);
 
     return () => {
+      if (flushTimer) clearTimeout(flushTimer);
       if (channel) {
         supabase.removeChannel(channel);
       }
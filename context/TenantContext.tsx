@@ -828,14 +828,32 @@ export const TenantProvider: React.FC<TenantProviderProps> = ({ children }) => {
     useEffect(() => {
         if (!currentTenant) return;
 
+        const USAGE_REFRESH_MS = 5 * 60 * 1000;
+        let lastRefresh = 0;
+        const run = () => {
+            lastRefresh = Date.now();
+            refreshUsage();
+        };
+
         // Deferred initial load — runs after UI is painted
-        const initial = setTimeout(() => refreshUsage(), 50);
+        const initial = setTimeout(run, 50);
 
+        // Every 5 minutes while the tab is visible. Background tabs skip the
+        // tick and catch up once on return if a refresh is overdue.
         const interval = setInterval(() => {
-            refreshUsage();
-        }, 5 * 60 * 1000); // Every 5 minutes
+            if (document.hidden) return;
+            run();
+        }, USAGE_REFRESH_MS);
+        const onVisible = () => {
+            if (!document.hidden && Date.now() - lastRefresh >= USAGE_REFRESH_MS) run();
+        };
+        document.addEventListener('visibilitychange', onVisible);
 
-        return () => { clearTimeout(initial); clearInterval(interval); };
+        return () => {
+            clearTimeout(initial);
+            clearInterval(interval);
+            document.removeEventListener('visibilitychange', onVisible);
+        };
     }, [currentTenant, refreshUsage]);
 
     const value: TenantContextType = {
@@ -6,6 +6,7 @@ import { useCallback, useEffect, useMemo, useState } from 'react';
 import { supabase } from '../lib/supabase';
 import { useTenant } from '../context/TenantContext';
 import { errorLogger } from '../lib/errorLogger';
+import { useDebouncedRefresh } from './useDebouncedRefresh';
 import type { Automation, AutomationInsert, AutomationLog } from '../types';
 
 interface UseAutomationsState {
@@ -47,15 +48,21 @@ export const useAutomations = (): UseAutomationsState => {
 
   useEffect(() => { refresh(); }, [refresh]);
 
+  const scheduleRefresh = useDebouncedRefresh(refresh);
+
   useEffect(() => {
     if (!currentTenant?.id) return;
+    // A run writes several automation_logs rows back to back; reload once
+    // after the burst instead of per row.
     const ch = supabase
       .channel(`automations-${currentTenant.id}`)
-      .on('postgres_changes', { event: '*', schema: 'public', table: 'automations',     filter: `tenant_id=eq.${currentTenant.id}` }, () => refresh())
-      .on('postgres_changes', { event: '*', schema: 'public', table: 'automation_logs', filter: `tenant_id=eq.${currentTenant.id}` }, () => refresh())
+      .on('postgres_changes', { event: '*', schema: 'public', table: 'automations',     filter: `tenant_id=eq.${currentTenant.id}` }, scheduleRefresh)
+      .on('postgres_changes', { event: '*', schema: 'public', table: 'automation_logs', filter: `tenant_id=eq.${currentTenant.id}` }, scheduleRefresh)
       .subscribe();
-    return () => { supabase.removeChannel(ch); };
-  }, [currentTenant?.id, refresh]);
+    return () => {
+      supabase.removeChannel(ch);
+    };
+  }, [currentTenant?.id, scheduleRefresh]);
 
   const upsertAutomation = useCallback<UseAutomationsState['upsertAutomation']>(async (data) => {
     if (!currentTenant?.id) return null;
@@ -14,6 +14,7 @@ import { useCallback, useEffect, useMemo, useState } from 'react';
 import { supabase } from '../lib/supabase';
 import { useTenant } from '../context/TenantContext';
 import { errorLogger } from '../lib/errorLogger';
+import { useDebouncedRefresh } from './useDebouncedRefresh';
 import type { Brand, BrandInsert, BrandMoodboardItem, BrandReference } from '../types';
 
 interface UseBrandsState {
@@ -76,17 +77,23 @@ export const useBrands = (): UseBrandsState => {
 
   useEffect(() => { refresh(); }, [refresh]);
 
+  const scheduleRefresh = useDebouncedRefresh(refresh);
+
   // ── Realtime — keep brands list in sync across tabs ─────────────
   useEffect(() => {
     if (!currentTenant?.id) return;
+    // A moodboard reorder or bulk import lands as one event per row; fold
+    // the burst into a single three-table reload.
     const channel = supabase
       .channel(`brands-${currentTenant.id}`)
-      .on('postgres_changes', { event: '*', schema: 'public', table: 'brands', filter: `tenant_id=eq.${currentTenant.id}` }, () => refresh())
-      .on('postgres_changes', { event: '*', schema: 'public', table: 'brand_moodboard', filter: `tenant_id=eq.${currentTenant.id}` }, () => refresh())
-      .on('postgres_changes', { event: '*', schema: 'public', table: 'brand_references', filter: `tenant_id=eq.${currentTenant.id}` }, () => refresh())
+      .on('postgres_changes', { event: '*', schema: 'public', table: 'brands', filter: `tenant_id=eq.${currentTenant.id}` }, scheduleRefresh)
+      .on('postgres_changes', { event: '*', schema: 'public', table: 'brand_moodboard', filter: `tenant_id=eq.${currentTenant.id}` }, scheduleRefresh)
+      .on('postgres_changes', { event: '*', schema: 'public', table: 'brand_references', filter: `tenant_id=eq.${currentTenant.id}` }, scheduleRefresh)
       .subscribe();
-    return () => { supabase.removeChannel(channel); };
-  }, [currentTenant?.id, refresh]);
+    return () => {
+      supabase.removeChannel(channel);
+    };
+  }, [currentTenant?.id, scheduleRefresh]);
 
   // ── Mutations ───────────────────────────────────────────────────
   const upsertBrand = useCallback<UseBrandsState['upsertBrand']>(async (data) => {
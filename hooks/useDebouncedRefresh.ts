@@ -0,0 +1,34 @@
+/**
+ * useDebouncedRefresh — coalesce a burst of realtime row events into a
+ * single reload. Returns a stable trigger to pass as the
+ * postgres_changes handler; the reload runs once the events have been
+ * quiet for `delayMs`.
+ *
+ *   const scheduleRefresh = useDebouncedRefresh(refresh);
+ *   supabase.channel(...).on('postgres_changes', {...}, scheduleRefresh)
+ *
+ * The trigger is stable across renders (it always calls the latest
+ * `refresh`), so it doesn't force the channel to resubscribe. A pending
+ * reload is dropped on unmount.
+ */
+
+import { useCallback, useEffect, useRef } from 'react';
+
+export function useDebouncedRefresh(refresh: () => unknown, delayMs = 300): () => void {
+  const refreshRef = useRef(refresh);
+  const timerRef = useRef<ReturnType<typeof setTimeout> | null>(null);
+
+  useEffect(() => { refreshRef.current = refresh; }, [refresh]);
+
+  useEffect(() => () => {
+    if (timerRef.current) clearTimeout(timerRef.current);
+  }, []);
+
+  return useCallback(() => {
+    if (timerRef.current) clearTimeout(timerRef.current);
+    timerRef.current = setTimeout(() => {
+      timerRef.current = null;
+      refreshRef.current();
+    }, delayMs);
+  }, [delayMs]);
+}
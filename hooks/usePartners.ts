@@ -7,6 +7,7 @@ import { useCallback, useEffect, useMemo, useState } from 'react';
 import { supabase } from '../lib/supabase';
 import { useTenant } from '../context/TenantContext';
 import { errorLogger } from '../lib/errorLogger';
+import { useDebouncedRefresh } from './useDebouncedRefresh';
 import type { Partner, PartnerInsert, PartnerWidget, PartnerWidgetConfig, PartnerWidgetType } from '../types';
 
 interface UsePartnersState {
@@ -60,16 +61,21 @@ export const usePartners = (): UsePartnersState & { generateReferralCode: (len?:
 
   useEffect(() => { refresh(); }, [refresh]);
 
+  const scheduleRefresh = useDebouncedRefresh(refresh);
+
   // Realtime — partner + widget changes propagate across tabs.
   useEffect(() => {
     if (!currentTenant?.id) return;
+    // Coalesce bursts of row events (widget reorders, bulk edits) into one reload.
     const ch = supabase
       .channel(`partners-${currentTenant.id}`)
-      .on('postgres_changes', { event: '*', schema: 'public', table: 'partners',        filter: `tenant_id=eq.${currentTenant.id}` }, () => refresh())
-      .on('postgres_changes', { event: '*', schema: 'public', table: 'partner_widgets', filter: `tenant_id=eq.${currentTenant.id}` }, () => refresh())
+      .on('postgres_changes', { event: '*', schema: 'public', table: 'partners',        filter: `tenant_id=eq.${currentTenant.id}` }, scheduleRefresh)
+      .on('postgres_changes', { event: '*', schema: 'public', table: 'partner_widgets', filter: `tenant_id=eq.${currentTenant.id}` }, scheduleRefresh)
       .subscribe();
-    return () => { supabase.removeChannel(ch); };
-  }, [currentTenant?.id, refresh]);
+    return () => {
+      supabase.removeChannel(ch);
+    };
+  }, [currentTenant?.id, scheduleRefresh]);
 
   const upsertPartner = useCallback<UsePartnersState['upsertPartner']>(async (data) => {
     if (!currentTenant?.id) return null;
@@ -66,6 +66,10 @@ export function useVoiceInput(opts: VoiceInputOptions = {}): VoiceInputState {
   // Accumulate the running transcript outside of React state so we can
   // hand the final string to onFinal without an extra render.
   const transcriptRef = useRef('');
+  // Finalized results never change once reported, so their text is
+  // folded in here once and only the interim tail is re-read per event.
+  const finalTextRef = useRef('');
+  const finalCountRef = useRef(0);
   // When the current listening session was started by startHold(),
   // the eventual onend should also fire onAutoSend. We track this via
   // a ref because the SpeechRecognition.onend callback only sees
@@ -95,6 +99,8 @@ export function useVoiceInput(opts: VoiceInputOptions = {}): VoiceInputState {
 
     setError(null);
     transcriptRef.current = '';
+    finalTextRef.current = '';
+    finalCountRef.current = 0;
     const SR = (window as any).SpeechRecognition || (window as any).webkitSpeechRecognition;
     const recog = new SR();
     recog.continuous = true;       // keep listening until we explicitly stop
@@ -104,9 +110,18 @@ export function useVoiceInput(opts: VoiceInputOptions = {}): VoiceInputState {
     recog.onresult = (e: any) => {
       // SpeechRecognition emits a growing list of results; concatenate
       // all final + interim transcripts so the live text is monotonic.
-      let full = '';
-      for (let i = 0; i < e.results.length; i++) {
-        full += e.results[i][0].transcript;
+      // Long dictations accumulate dozens of results, so the leading
+      // final ones are consumed once instead of rescanned every event.
+      const results = e.results;
+      let i = finalCountRef.current;
+      while (i < results.length && results[i].isFinal) {
+        finalTextRef.current += results[i][0].transcript;
+        i++;
+      }
+      finalCountRef.current = i;
+      let full = finalTextRef.current;
+      for (; i < results.length; i++) {
+        full += results[i][0].transcript;
       }
       transcriptRef.current = full;
       optsRef.current.onPartial?.(full);
@@ -8,8 +8,8 @@ export const calendarAgent: AgentDefinition = {
   domain: 'calendar',
   routingHints: [
     'calendar', 'event', 'meeting', 'schedule', 'agenda', 'tomorrow',
-    'this week', 'next week', 'conflict', 'free slot', 'reuniÃ³n',
-    'evento', 'maÃ±ana', 'agenda', 'reagendar', 'reschedule', 'time block',
+    'this week', 'next week', 'conflict', 'free slot', 'reunión',
+    'evento', 'mañana', 'agenda', 'reagendar', 'reschedule', 'time block',
     'hoy', 'today', 'semana',
   ],
   skills: calendarSkills,
@@ -8,9 +8,9 @@ export const clientsAgent: AgentDefinition = {
   domain: 'clients',
   routingHints: [
     'client', 'clients', 'cliente', 'crm', 'prospect', 'lead',
-    'who is', 'quÃ© hace', 'contacto', 'company', 'industry',
-    'partner agency', 'invite client', 'about', 'quiÃ©n es',
-    'relaciÃ³n', 'retainer', 'deal',
+    'who is', 'qué hace', 'contacto', 'company', 'industry',
+    'partner agency', 'invite client', 'about', 'quién es',
+    'relación', 'retainer', 'deal',
   ],
   skills: clientSkills,
   systemPrompt: [
@@ -8,7 +8,7 @@ export const financeAgent: AgentDefinition = {
   domain: 'finance',
   routingHints: [
     'finance', 'income', 'expense', 'profit', 'invoice', 'installment',
-    'cuota', 'cobrado', 'ingreso', 'gasto', 'facturaciÃ³n', 'budget',
+    'cuota', 'cobrado', 'ingreso', 'gasto', 'facturación', 'budget',
     'milestone', 'overdue payment', 'monthly summary', 'this month',
     'cash flow', 'collect', 'paid', 'pending', 'plata', 'dinero',
     'cobrar', 'pagar', 'margen', 'rentabilidad',
@@ -16,8 +16,8 @@ export const inboxAgent: AgentDefinition = {
     'resumir', 'resumen', 'digest', 'summary',
     'draft', 'redactar', 'respuesta', 'contestar',
     'canal', 'channel', 'comunicaci', 'communication',
-    'quÃ© cambiÃ³', 'que cambio', 'catch me up', 'what changed',
-    'quÃ© dijo', 'que dijo', 'quÃ© dice', 'que dice',
+    'qué cambió', 'que cambio', 'catch me up', 'what changed',
+    'qué dijo', 'que dijo', 'qué dice', 'que dice',
     'pipeline',
   ],
   skills: inboxSkills,
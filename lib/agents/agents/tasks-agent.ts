@@ -13,7 +13,7 @@ export const tasksAgent: AgentDefinition = {
     'moveme', 'movela', 'movelo', 'reprogram', 'pospon', 'reschedule',
     'move to', 'move the', 'cambiar fecha', 'cambiar la fecha', 'due date',
     'create task', 'new task', 'remind me to', 'add a task',
-    'quÃ© tengo', 'que tengo', 'quÃ© hago', 'que hago', 'priorizar',
+    'qué tengo', 'que tengo', 'qué hago', 'que hago', 'priorizar',
     'pipeline',
   ],
   skills: taskSkills,
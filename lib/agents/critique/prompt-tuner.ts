@@ -275,8 +275,11 @@ export async function runPromptTuner(args: RunPromptTunerArgs): Promise<RunPromp
     const r = await sendAdvisorChat('', [], prompt);
     let raw = ((r as any)?.reply || '').trim();
     // Salvage the JSON if the model wrapped it in markdown ```json ... ```
-    const fenceMatch = raw.match(/```(?:json)?\s*([\s\S]*?)```/);
-    if (fenceMatch) raw = fenceMatch[1].trim();
+    // (a bare object — the common case — skips the fence scan entirely).
+    if (!raw.startsWith('{')) {
+      const fenceMatch = raw.match(/```(?:json)?\s*([\s\S]*?)```/);
+      if (fenceMatch) raw = fenceMatch[1].trim();
+    }
     parsed = JSON.parse(raw);
   } catch (e: any) {
     reason = `Meta-model returned unparseable output: ${e?.message}`;
@@ -101,27 +101,45 @@ const parseActionsFromReply = (reply: string): { cleanReply: string; actions: Pr
 // Considers per-agent overrides — added hints can promote an agent
 // the defaults wouldn't have matched, removed hints demote agents
 // that were misrouting on certain words.
-/** Score how many routing hints an agent matches for a query. */
+/** Lower-case and strip diacritics so "facturación" matches "facturacion". */
+const foldText = (text: string): string =>
+  text.toLowerCase().normalize('NFD').replace(/[\u0300-\u036f]/g, '');
+
+// Default hint lists are static, so they're folded once per agent.
+// Overridden lists are rebuilt per turn and folded on the fly.
+const foldedDefaultHints = new Map<string, string[]>();
+const foldedHints = (agent: AgentDefinition, override?: ActiveOverride): string[] => {
+  if (override) return effectiveRoutingHints(agent, override).map(foldText);
+  let folded = foldedDefaultHints.get(agent.id);
+  if (!folded) {
+    folded = agent.routingHints.map(foldText);
+    foldedDefaultHints.set(agent.id, folded);
+  }
+  return folded;
+};
+
+/** Score how many routing hints an agent matches for an already-folded query. */
 const scoreAgent = (
   agent: AgentDefinition,
-  query: string,
+  foldedQuery: string,
   overridesMap?: Map<string, ActiveOverride>,
 ): number => {
-  const lowered = query.toLowerCase();
-  const hints = overridesMap
-    ? effectiveRoutingHints(agent, overridesMap.get(agent.id))
-    : agent.routingHints;
-  return hints.filter(h => lowered.includes(h.toLowerCase())).length;
+  let score = 0;
+  for (const h of foldedHints(agent, overridesMap?.get(agent.id))) {
+    if (foldedQuery.includes(h)) score++;
+  }
+  return score;
 };
 
+/** Pick the best-matching agent for an already-folded query. */
 const routeAgent = (
-  query: string,
+  folded: string,
   overridesMap?: Map<string, ActiveOverride>,
 ): AgentDefinition => {
   let best = AGENTS[0];
   let bestScore = 0;
   for (const a of AGENTS) {
-    const score = scoreAgent(a, query, overridesMap);
+    const score = scoreAgent(a, folded, overridesMap);
     if (score > bestScore) {
       best = a;
       bestScore = score;
@@ -133,14 +151,61 @@ const routeAgent = (
   // clients and incomes". Route those to the onboarding agent, which
   // owns the reconcile-then-propose flow, unless another agent matched
   // strongly on its own.
-  if (query.length > 700 && bestScore <= 1) {
-    const intake = AGENTS.find(a => a.id === 'onboarding-agent');
+  if (folded.length > 700 && bestScore <= 1) {
+    const intake = AGENT_BY_ID.get('onboarding-agent');
     if (intake) return intake;
   }
   return best;
 };
 
+/** Routing internals, exported for unit tests only. */
+export const __routingForTests = { foldText, scoreAgent, routeAgent };
+
 // ── 2. Run a curated set of read skills for the chosen agent ─────────
+// Skills whose id ends with one of these always run when their agent
+// is selected — the user expects "resumir inbox" to show real data even
+// when the query shares no words with the skill id.
+const ALWAYS_ON_SUFFIXES = [
+  'list_open_for_me', 'list_overdue', 'today_events', 'pending',
+  // Inbox agent skills
+  'recent', 'summary_stats', 'conversation_summary', 'slack_channels',
+];
+
+interface SkillRelevance {
+  /** Tokens of the skill id ('tasks.list_overdue' → tasks, list, overdue). */
+  hints: string[];
+  alwaysOn: boolean;
+  /** validate({}) throws — the skill has required params. */
+  needsParams: boolean;
+}
+
+const requiresParams = (skill: Skill): boolean => {
+  if (!skill.validate) return false;
+  try {
+    skill.validate({});
+    return false;
+  } catch {
+    return true;
+  }
+};
+
+// Skill ids and validators are static, so relevance tokens and the
+// required-params probe are derived once per skill instead of re-splitting
+// the id and catching a validation error on every turn.
+const relevanceCache = new Map<string, SkillRelevance>();
+const skillRelevance = (skill: Skill): SkillRelevance => {
+  let meta = relevanceCache.get(skill.id);
+  if (!meta) {
+    meta = {
+      hints: skill.id.split(/[._]/),
+      alwaysOn: ALWAYS_ON_SUFFIXES.some(suffix => skill.id.endsWith(suffix)),
+      needsParams: requiresParams(skill),
+    };
+    relevanceCache.set(skill.id, meta);
+  }
+  return meta;
+};
+
 // Without skill calling tools (we don't ship full function-calling
 // yet), the heuristic is: run every read skill that has no required
 // params + the first few that match obvious patterns. We cap by
@@ -153,55 +218,49 @@ const runAgentSkills = async (
 ): Promise<Array<{ skill: Skill; result: SkillResult }>> => {
   const lowered = query.toLowerCase();
   const max = agent.maxSkillCallsPerTurn || 3;
-  const out: Array<{ skill: Skill; result: SkillResult }> = [];
+  const picked: Array<{ skill: Skill; args: any }> = [];
 
   for (const skill of agent.skills) {
-    if (out.length >= max) break;
+    if (picked.length >= max) break;
     if (disabledSkills.has(skill.id)) continue; // turned off by a tenant override
     if (skill.kind === 'write') continue; // never auto-run writes
     // For skills with required params we'd need argument extraction —
     // skip those in this version. Run only zero-arg or self-defaulted
     // skills, which covers the "summary / list / status" use cases.
+    const relevance = skillRelevance(skill);
     let validated: any;
-    try {
+    if (!relevance.needsParams) {
       validated = skill.validate ? skill.validate({}) : {};
-    } catch {
+    } else if (skill.id === 'tasks.search') {
       // Required params missing — try to opportunistically extract some
       // by looking for project mentions in the query. Cheap heuristic.
-      if (skill.id === 'tasks.search') {
-        validated = { query: query.slice(0, 60) };
-      } else {
-        continue;
-      }
+      validated = { query: query.slice(0, 60) };
+    } else {
+      continue;
     }
     // Filter out skills that don't seem relevant to the query (cheap
     // optimization: avoid burning time on "today_events" when the user
     // asked about overdue tasks).
-    const relevanceHints = skill.id.split(/[._]/);
-    const hitsRelevance = relevanceHints.some(h => lowered.includes(h));
-    const isAlwaysOn = skill.id.endsWith('list_open_for_me')
-      || skill.id.endsWith('list_overdue')
-      || skill.id.endsWith('today_events')
-      || skill.id.endsWith('pending')
-      // Inbox agent skills that should always run when the agent is
-      // selected — the user expects "resumir inbox" to show real data.
-      || skill.id.endsWith('recent')
-      || skill.id.endsWith('summary_stats')
-      || skill.id.endsWith('conversation_summary')
-      || skill.id.endsWith('slack_channels');
-    if (!hitsRelevance && !isAlwaysOn && out.length > 0) continue;
+    if (!relevance.alwaysOn && picked.length > 0 && !relevance.hints.some(h => lowered.includes(h))) continue;
+    picked.push({ skill, args: validated });
+  }
+
+  // Selection never looks at results, and only read skills get here, so the
+  // picked skills run concurrently; the turn waits on the slowest one rather
+  // than the sum of all of them. Order in the trace matches the agent's list.
+  return Promise.all(picked.map(async ({ skill, args }) => {
     try {
-      const result = await skill.run(validated, ctx);
-      out.push({ skill, result });
+      return { skill, result: await skill.run(args, ctx) };
     } catch (e: any) {
-      out.push({ skill, result: { ok: false, kind: 'none', reason: e?.message || 'skill_error' } });
+      return { skill, result: { ok: false, kind: 'none', reason: e?.message || 'skill_error' } as SkillResult };
     }
-  }
-  return out;
+  }));
 };
 
 // ── 3. Build the LLM prompt from the skill results ───────────────────
 
+const LONG_TEXT_FIELDS = new Set(['body_text', 'description', 'notes', 'content', 'body']);
+
 /** Compact a raw data row for the LLM prompt. Trims long text fields
  *  (body_text, description, notes) to short previews so the LLM
  *  synthesizes instead of dumping raw content. */
@@ -209,7 +268,7 @@ const compactRow = (row: any): any => {
   if (!row || typeof row !== 'object') return row;
   const out: any = {};
   for (const [k, v] of Object.entries(row)) {
-    if (typeof v === 'string' && v.length > 120 && ['body_text', 'description', 'notes', 'content', 'body'].includes(k)) {
+    if (typeof v === 'string' && v.length > 120 && LONG_TEXT_FIELDS.has(k)) {
       out[k] = v.slice(0, 100).replace(/\s+/g, ' ').trim() + '…';
     } else if (k === 'messages' && Array.isArray(v)) {
       // Grouped skill data (e.g. slack_channels → { channel, messages[] })
@@ -277,6 +336,12 @@ export async function runOrchestrator(
   const surfaceKey = options.surface || '';
   const surfaceCfg = resolveSurface(surfaceKey);
 
+  // The learned profile doesn't depend on which agent wins, so its fetch
+  // overlaps routing + skills instead of running after them.
+  const profilePromise = getUserProfile(input.ctx.db, {
+    userId: input.ctx.userId, tenantId: input.ctx.tenantId,
+  });
+
   // Fetch active per-tenant agent overrides FIRST so routing sees the
   // tuned routing hints, not just the defaults. Cached for 5 min so
   // the per-turn cost is one cache lookup in steady state.
@@ -288,16 +353,17 @@ export async function runOrchestrator(
   //   2. keyword routing — if the query strongly matches a domain
   //   3. surface preferred agent — fallback bias from the current section/persona
   //   4. default to first agent in registry
+  const foldedQuery = foldText(input.query);
   let agent: AgentDefinition;
   if (input.forcedAgentId) {
-    agent = AGENT_BY_ID.get(input.forcedAgentId) || routeAgent(input.query, overridesMap);
+    agent = AGENT_BY_ID.get(input.forcedAgentId) || routeAgent(foldedQuery, overridesMap);
   } else {
-    const routed = routeAgent(input.query, overridesMap);
+    const routed = routeAgent(foldedQuery, overridesMap);
     // Check if routing actually matched something meaningful (score > 0).
     // If the router returned the default agent with score 0, prefer the
     // surface's bias instead — the user's section context is a stronger
     // signal than "no keywords matched".
-    const routedScore = scoreAgent(routed, input.query, overridesMap);
+    const routedScore = scoreAgent(routed, foldedQuery, overridesMap);
     if (routedScore === 0 && surfaceCfg.preferredAgentId) {
       agent = AGENT_BY_ID.get(surfaceCfg.preferredAgentId) || routed;
     } else {
@@ -313,9 +379,7 @@ export async function runOrchestrator(
   const skillContextBlock = formatSkillResultsForPrompt(trace);
 
   // Pull the user's learned profile to adapt tone/style to them
-  const profile = await getUserProfile(input.ctx.db, {
-    userId: input.ctx.userId, tenantId: input.ctx.tenantId,
-  });
+  const profile = await profilePromise;
   const profileBlock = formatProfileForPrompt(profile);
 
   // Hand off to Gemini with the agent persona + profile + real data.
@@ -403,7 +467,12 @@ export async function runOrchestrator(
     // Look at the previous user turn in history for re-ask detection.
     // The most recent user turn in history === their PREVIOUS query
     // (since current query isn't in history yet).
-    const lastUserTurn = [...(input.history || [])].reverse().find(h => h.role === 'user');
+    // Walk backwards instead of copying + reversing the whole history.
+    const hist = input.history || [];
+    let lastUserTurn: (typeof hist)[number] | undefined;
+    for (let i = hist.length - 1; i >= 0; i--) {
+      if (hist[i].role === 'user') { lastUserTurn = hist[i]; break; }
+    }
     if (lastUserTurn) {
       if (detectReAsk(input.query, lastUserTurn.content)) {
         // The previous conversation row was bad — but we don't have its
@@ -57,6 +57,8 @@ async function fetchTeamEmails(ctx: ExecutionContext): Promise<Set<string>> {
   }
 }
 
+const PENDINGISH_STATUSES = new Set(['pending', 'snoozed']);
+
 // Tag teammate-authored messages as outbound + handled (in memory only — never
 // written to the DB) so grouping / follow-up logic never counts them as a
 // pending request needing our reply.
@@ -64,7 +66,7 @@ const tagTeamOutbound = (messages: any[], teamEmails: Set<string>): any[] =>
   (messages || []).map(m => {
     const fromTeam = teamEmails.size > 0 && teamEmails.has(String(m.from_email || '').toLowerCase());
     if (!fromTeam) return { ...m, from_team: false };
-    const pendingish = ['pending', 'snoozed'].includes(String(m.status || '').toLowerCase());
+    const pendingish = PENDINGISH_STATUSES.has(String(m.status || '').toLowerCase());
     return { ...m, from_team: true, direction: 'outbound', status: pendingish ? 'auto_resolved' : m.status };
   });
 
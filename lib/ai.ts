@@ -5,8 +5,19 @@ import { supabase } from './supabase'
 // Cache is per-type + input hash, stored in localStorage for cross-navigation persistence.
 
 type AICacheEntry = {
-  result: unknown
   timestamp: number
+  result: unknown
+}
+
+// Entries are written timestamp-first, so eviction can read the age off the
+// front of the string instead of JSON-parsing up to 30KB of cached result.
+const ENTRY_TIMESTAMP_PREFIX = /^\{"timestamp":(\d+)/
+
+/** Age of a raw cache entry; falls back to a full parse for old-format rows. */
+function readEntryTimestamp(raw: string): number {
+  const m = ENTRY_TIMESTAMP_PREFIX.exec(raw)
+  if (m) return Number(m[1])
+  return (JSON.parse(raw) as AICacheEntry).timestamp || 0
 }
 
 /** TTL per request type (in milliseconds) */
@@ -43,17 +54,51 @@ const hashInput = (s: string): string => {
 
 const cacheKey = (type: string, input: string) => `${CACHE_VERSION}:${type}:${hashInput(input)}`
 
+// In-memory layer over localStorage. It holds the serialized entry, not the
+// parsed result: every hit still pays one JSON.parse, so each caller gets an
+// isolated copy it can mutate freely (structuredClone benchmarked ~1.7x
+// slower than parse on a 27KB advisor payload). What it saves is the storage
+// read, and it keeps entries too big for localStorage (> 30KB) served for
+// the rest of the session instead of re-calling the model.
+const MAX_MEMORY_ENTRIES = 64
+const memoryCache = new Map<string, { timestamp: number; raw: string }>()
+
+function rememberEntry(key: string, timestamp: number, raw: string): void {
+  memoryCache.delete(key)
+  if (memoryCache.size >= MAX_MEMORY_ENTRIES) {
+    memoryCache.delete(memoryCache.keys().next().value as string)
+  }
+  memoryCache.set(key, { timestamp, raw })
+}
+
+// `storage` only fires for writes made by other tabs — drop our copy of any
+// ai cache key they touched (a purge or clearAICache there reaches here too).
+if (typeof window !== 'undefined') {
+  window.addEventListener('storage', (e) => {
+    if (e.key === null) memoryCache.clear()
+    else if (e.key.startsWith(`${CACHE_VERSION}:`)) memoryCache.delete(e.key)
+  })
+}
+
 function getCached<T>(type: string, input: string): T | null {
   const ttl = CACHE_TTL[type] ?? 0
   if (ttl === 0) return null
+  const key = cacheKey(type, input)
+  const hit = memoryCache.get(key)
+  if (hit) {
+    if (Date.now() - hit.timestamp <= ttl) return (JSON.parse(hit.raw) as AICacheEntry).result as T
+    memoryCache.delete(key)
+  }
   try {
-    const raw = localStorage.getItem(cacheKey(type, input))
+    const raw = localStorage.getItem(key)
     if (!raw) return null
-    const entry: AICacheEntry = JSON.parse(raw)
-    if (Date.now() - entry.timestamp > ttl) {
-      localStorage.removeItem(cacheKey(type, input))
+    const timestamp = readEntryTimestamp(raw)
+    if (Date.now() - timestamp > ttl) {
+      localStorage.removeItem(key)
       return null
     }
+    const entry = JSON.parse(raw) as AICacheEntry
+    rememberEntry(key, timestamp, raw)
     return entry.result as T
   } catch {
     return null
@@ -68,10 +113,10 @@ function evictExpiredCache(): void {
       const k = localStorage.key(i)
       if (!k?.startsWith(`${CACHE_VERSION}:`)) continue
       try {
-        const entry: AICacheEntry = JSON.parse(localStorage.getItem(k) || '')
+        const timestamp = readEntryTimestamp(localStorage.getItem(k) || '')
         const typePart = k.split(':')[1] || ''
         const ttl = CACHE_TTL[typePart] ?? 0
-        if (ttl === 0 || now - entry.timestamp > ttl) toRemove.push(k)
+        if (ttl === 0 || now - timestamp > ttl) toRemove.push(k)
       } catch {
         toRemove.push(k) // corrupted entry
       }
@@ -96,8 +141,7 @@ function listAICacheEntries(): { key: string; size: number; timestamp: number }[
       const raw = localStorage.getItem(k) || ''
       let timestamp = 0
       try {
-        const parsed: AICacheEntry = JSON.parse(raw)
-        timestamp = parsed.timestamp || 0
+        timestamp = readEntryTimestamp(raw)
       } catch { /* corrupted — treat as oldest */ }
       entries.push({ key: k, size: raw.length, timestamp })
     }
@@ -125,6 +169,7 @@ function enforceAICacheBudget(targetBytes: number = MAX_AI_CACHE_TOTAL_BYTES): v
 
 /** Hard purge: remove every ai cache key. Last resort if storage is wedged. */
 function purgeAllAICache(): void {
+  memoryCache.clear()
   try {
     const entries = listAICacheEntries()
     for (const e of entries) {
@@ -136,26 +181,28 @@ function purgeAllAICache(): void {
 function setCache(type: string, input: string, result: unknown): void {
   const ttl = CACHE_TTL[type] ?? 0
   if (ttl === 0) return
+  const key = cacheKey(type, input)
+  const entry: AICacheEntry = { timestamp: Date.now(), result }
   let value = ''
   try {
-    const entry: AICacheEntry = { result, timestamp: Date.now() }
     value = JSON.stringify(entry)
+    rememberEntry(key, entry.timestamp, value)
     if (value.length > MAX_AI_CACHE_ENTRY_BYTES) {
-      if (import.meta.env.DEV) console.log(`[AI] Skip cache: entry ${value.length}B > limit ${MAX_AI_CACHE_ENTRY_BYTES}B`)
+      if (import.meta.env.DEV) console.log(`[AI] Skip storage: entry ${value.length}B > limit ${MAX_AI_CACHE_ENTRY_BYTES}B (memory only)`)
       return
     }
     // Proactively make room before writing — never wait for QuotaExceededError
     // because by the time we get one, Supabase auth may have already failed to
     // persist a refreshed token, leaving the user stuck at "session expired".
     enforceAICacheBudget(MAX_AI_CACHE_TOTAL_BYTES - value.length)
-    localStorage.setItem(cacheKey(type, input), value)
+    localStorage.setItem(key, value)
   } catch {
     // QuotaExceededError despite the proactive eviction (other tabs / other
     // app state filled it). Recovery ladder: expired → halve budget → purge all.
     try {
       evictExpiredCache()
       enforceAICacheBudget(Math.floor(MAX_AI_CACHE_TOTAL_BYTES / 2))
-      localStorage.setItem(cacheKey(type, input), value)
+      localStorage.setItem(key, value)
     } catch {
       // Still full — drop the entire ai cache. Better to lose cache than to
       // wedge Supabase auth's ability to persist tokens.
@@ -165,6 +212,9 @@ function setCache(type: string, input: string, result: unknown): void {
   }
 }
 
+/** Cache internals, exported for unit tests only — app code goes through callGemini/clearAICache. */
+export const __aiCacheForTests = { getCached, setCache, purgeAllAICache, readEntryTimestamp }
+
 // Self-heal on module load: if the previous page session left an oversize
 // cache (pre-fix users), trim it before any auth/AI calls happen. Cheap —
 // just iterates ai_v2:* keys.
@@ -1348,6 +1398,9 @@ export const generateAd = (args: GenerateAdInput): Promise<AdResult> =>
 
 /** Force-clear all AI caches (e.g., when user wants fresh results) */
 export const clearAICache = (type?: string): void => {
+  for (const k of [...memoryCache.keys()]) {
+    if (!type || k.startsWith(`${CACHE_VERSION}:${type}:`)) memoryCache.delete(k)
+  }
   try {
     const keys: string[] = []
     for (let i = 0; i < localStorage.length; i++) {
@@ -22,13 +22,24 @@ const TONE_HINTS: Record<string, string> = {
   coaching: 'Style: coaching. Ask one short prioritization question when useful.',
 };
 
+// Emoji markers (and their mojibake forms from double-encoded UTF-8) the
+// card bullets carry. Rewritten in one pass over the string.
+const BRIEF_GLYPHS: Record<string, string> = {
+  'ðŸ”¥': 'High priority:',
+  '🔥': 'High priority:',
+  'ðŸŽ¯': '',
+  '🎯': '',
+  'âš ': 'Risk:',
+  '⚠': 'Risk:',
+  'ðŸ“…': '',
+  '📅': '',
+  'Â·': '·',
+};
+const BRIEF_GLYPH_RE = /ðŸ”¥|🔥|ðŸŽ¯|🎯|âš |⚠|ðŸ“…|📅|Â·/g;
+
 const cleanBriefText = (value: unknown): string =>
   String(value ?? '')
-    .replace(/ðŸ”¥|🔥/g, 'High priority:')
-    .replace(/ðŸŽ¯|🎯/g, '')
-    .replace(/âš |⚠/g, 'Risk:')
-    .replace(/ðŸ“…|📅/g, '')
-    .replace(/Â·/g, '·')
+    .replace(BRIEF_GLYPH_RE, glyph => BRIEF_GLYPHS[glyph])
     .replace(/\s+/g, ' ')
     .trim();
 
@@ -108,8 +119,11 @@ export async function synthesizeBrief(args: SynthesizeArgs): Promise<BriefSynthe
   try {
     const r = await sendAdvisorChat('', [], prompt);
     let raw = ((r as any)?.reply || '').trim();
-    const fenceMatch = raw.match(/```(?:json)?\s*([\s\S]*?)```/);
-    if (fenceMatch) raw = fenceMatch[1].trim();
+    // The model usually honours "ONLY JSON"; only scan for a fence when it didn't.
+    if (!raw.startsWith('{')) {
+      const fenceMatch = raw.match(/```(?:json)?\s*([\s\S]*?)```/);
+      if (fenceMatch) raw = fenceMatch[1].trim();
+    }
     const parsed = JSON.parse(raw);
     const message = String(parsed.message || '').trim().slice(0, 3000);
     if (!message) return null;
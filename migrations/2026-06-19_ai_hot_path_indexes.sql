@@ -0,0 +1,23 @@
+-- =============================================================================
+-- Indexes for the per-turn AI query paths
+-- =============================================================================
+-- Each index below matches a query that runs on every AI turn:
+--   - aurora-chat daily quota: all of a user's threads (archived included).
+--     Counting their 'user' messages in the last 24h is already served by
+--     aurora_messages_thread_idx (thread_id, created_at), so no new index
+--     goes on aurora_messages, the hottest insert path.
+--   - comm-classify thread context: the prior messages of the same thread,
+--     oldest first.
+-- The existing indexes either sit behind a WHERE archived_at IS NULL
+-- predicate the quota query can't use, or don't lead with the thread and
+-- sort key together.
+-- =============================================================================
+
+-- 1. Quota step 1 — `aurora_threads WHERE user_id = $1` (no archived filter).
+CREATE INDEX IF NOT EXISTS aurora_threads_user_all_idx
+  ON aurora_threads(user_id);
+
+-- 2. Classifier thread context — tenant + thread, ordered by received_at.
+CREATE INDEX IF NOT EXISTS idx_comm_messages_tenant_thread_received
+  ON communication_messages(tenant_id, thread_id, received_at)
+  WHERE thread_id IS NOT NULL;
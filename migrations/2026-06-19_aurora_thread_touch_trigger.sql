@@ -0,0 +1,32 @@
+-- =============================================================================
+-- Aurora — bump aurora_threads.last_message_at from the database
+-- =============================================================================
+-- aurora-chat and aurora-cron used to stamp last_message_at with the edge
+-- function's clock in a separate UPDATE after every turn. The thread's
+-- recency now follows its messages server-side: each assistant reply
+-- inserted into aurora_messages moves last_message_at to that row's
+-- created_at (NOW()). Only the assistant row fires it, so a turn (user row +
+-- assistant row) still costs one aurora_threads UPDATE and one realtime
+-- event, as before, minus the extra round-trip from the edge function.
+--
+-- Deploy this BEFORE the aurora-chat / aurora-cron versions that dropped
+-- their own UPDATE, or last_message_at stops moving in the meantime.
+-- =============================================================================
+
+CREATE OR REPLACE FUNCTION aurora_touch_thread()
+RETURNS TRIGGER AS $$
+BEGIN
+  UPDATE aurora_threads
+     SET last_message_at = NEW.created_at
+   WHERE id = NEW.thread_id
+     AND last_message_at < NEW.created_at;
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+DROP TRIGGER IF EXISTS trg_aurora_messages_touch_thread ON aurora_messages;
+CREATE TRIGGER trg_aurora_messages_touch_thread
+  AFTER INSERT ON aurora_messages
+  FOR EACH ROW
+  WHEN (NEW.role = 'assistant')
+  EXECUTE FUNCTION aurora_touch_thread();
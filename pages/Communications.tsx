@@ -61,6 +61,21 @@ function formatRelative(d: Date): string {
   return `${Math.round(h / 24)}d ago`;
 }
 
+// "Sync 12s ago" label. Owns its own 15s tick so aging the pill re-renders
+// only this span, not the whole page and its message list. Hidden tabs skip
+// the tick; the visibility-change sync refreshes lastSyncedAt on return.
+const SyncAge: React.FC<{ at: Date }> = ({ at }) => {
+  const [, setTick] = useState(0);
+  useEffect(() => {
+    const id = setInterval(() => {
+      if (typeof document !== 'undefined' && document.hidden) return;
+      setTick(n => n + 1);
+    }, 15_000);
+    return () => clearInterval(id);
+  }, [at]);
+  return <>{`Sync ${formatRelative(at)}`}</>;
+};
+
 // ────────────────────────────────────────────────────────────────────────
 //  ROOT PAGE
 // ────────────────────────────────────────────────────────────────────────
@@ -167,15 +182,6 @@ export const Communications: React.FC = () => {
     return () => document.removeEventListener('visibilitychange', handler);
   }, [runAutoSync]);
 
-  // Tick every 15s so the "Sync 12s ago" pill ages without waiting for
-  // the next sync cycle. Cheap setState — only updates this component.
-  const [, forceRerender] = useState(0);
-  useEffect(() => {
-    if (!lastSyncedAt) return;
-    const id = setInterval(() => forceRerender(n => n + 1), 15_000);
-    return () => clearInterval(id);
-  }, [lastSyncedAt]);
-
   if (!user || !tenantReady) {
     return (
       <div className="flex items-center justify-center h-64 text-zinc-400 text-sm">
@@ -201,7 +207,7 @@ export const Communications: React.FC = () => {
                 <span className="sep">·</span>
                 <span className="inline-flex items-center gap-1.5">
                   <span className={`cx-sync-dot ${isSyncing ? 'syncing' : 'synced'}`} />
-                  {isSyncing ? 'Syncing…' : `Sync ${formatRelative(lastSyncedAt)}`}
+                  {isSyncing ? 'Syncing…' : <SyncAge at={lastSyncedAt} />}
                 </span>
               </>
             )}
@@ -63,11 +63,21 @@ const SUPABASE_URL = Deno.env.get('SUPABASE_URL')!
 const SUPABASE_SERVICE_ROLE_KEY = Deno.env.get('SUPABASE_SERVICE_ROLE_KEY')!
 const SUPABASE_ANON_KEY = Deno.env.get('SUPABASE_ANON_KEY')!
 
-/** Service-role client — bypasses RLS. Use only after auth checks. */
-export const adminClient = (): SupabaseClient =>
-  createClient(SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY, {
-    auth: { persistSession: false, autoRefreshToken: false },
-  })
+let adminClientInstance: SupabaseClient | null = null
+
+/**
+ * Service-role client — bypasses RLS. Use only after auth checks.
+ * Holds no per-user state, so one instance is shared by every request
+ * the isolate serves.
+ */
+export function adminClient(): SupabaseClient {
+  if (!adminClientInstance) {
+    adminClientInstance = createClient(SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY, {
+      auth: { persistSession: false, autoRefreshToken: false },
+    })
+  }
+  return adminClientInstance
+}
 
 /** User-scoped client — respects RLS. Pass through the request's auth header. */
 export const userClient = (req: Request): SupabaseClient => {
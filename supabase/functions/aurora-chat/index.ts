@@ -17,6 +17,7 @@ import { createClient } from 'https://esm.sh/@supabase/supabase-js@2';
 import OpenAI from 'https://esm.sh/openai@4.71.0';
 import { AGENTS } from './agents.ts';
 import { runAgent } from './runner.ts';
+import { getCachedRoute, rememberRoute, smallTalkReply } from './route-cache.ts';
 
 const allowedOrigin = Deno.env.get('ALLOWED_ORIGINS') || '*';
 const corsHeaders = {
@@ -25,8 +26,41 @@ const corsHeaders = {
   'Access-Control-Allow-Methods': 'POST, OPTIONS',
 };
 
+// Secrets don't change for the life of an isolate — read them once at boot.
+const SUPABASE_URL = Deno.env.get('SUPABASE_URL')!;
+const SUPABASE_ANON_KEY = Deno.env.get('SUPABASE_ANON_KEY')!;
+const SUPABASE_SERVICE_ROLE_KEY = Deno.env.get('SUPABASE_SERVICE_ROLE_KEY')!;
+const OPENAI_API_KEY = Deno.env.get('OPENAI_API_KEY');
+
 const DAILY_QUOTA_PER_USER = 200;
 const HISTORY_TURNS = 10;
+// Per-message cap for replayed history. A pasted brief from three turns ago
+// would otherwise be resent in full on every turn (and every tool pass).
+const HISTORY_MESSAGE_CHARS = 2000;
+
+// Set AURORA_PROFILING=1 to log one per-phase timing line per turn.
+// Read once at boot so the off path costs a single null check per phase.
+const PROFILING = Deno.env.get('AURORA_PROFILING') === '1';
+
+// One OpenAI client per isolate. Warm invocations reuse it (and its
+// keep-alive connections) instead of building a fresh client per turn.
+let openaiClient: OpenAI | null = null;
+function getOpenAI(apiKey: string): OpenAI {
+  if (!openaiClient) openaiClient = new OpenAI({ apiKey });
+  return openaiClient;
+}
+
+// Service-role client: no session, no per-user headers, so it is shared by
+// every turn the isolate serves. The RLS-scoped client stays per request.
+let supabaseAdminClient: ReturnType<typeof createClient> | null = null;
+function getSupabaseAdmin() {
+  if (!supabaseAdminClient) {
+    supabaseAdminClient = createClient(SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY, {
+      auth: { autoRefreshToken: false, persistSession: false },
+    });
+  }
+  return supabaseAdminClient;
+}
 
 interface ChatBody {
   agent: string;
@@ -39,28 +73,31 @@ serve(async (req: Request) => {
   if (req.method === 'OPTIONS') return new Response('ok', { headers: corsHeaders });
   if (req.method !== 'POST')   return json({ error: 'method_not_allowed' }, 405);
 
+  const spans: Record<string, number> | null = PROFILING ? {} : null;
+  let lapStart = performance.now();
+  const lap = (phase: string) => {
+    if (!spans) return;
+    const now = performance.now();
+    spans[phase] = Math.round(now - lapStart);
+    lapStart = now;
+  };
+
   // --- Auth: extract JWT, build a per-user supabase client (RLS scoped) ---
   const authHeader = req.headers.get('Authorization') || '';
   const jwt = authHeader.replace('Bearer ', '').trim();
   if (!jwt) return json({ error: 'missing_authorization' }, 401);
 
-  const supabaseUrl = Deno.env.get('SUPABASE_URL')!;
-  const supabaseAnonKey = Deno.env.get('SUPABASE_ANON_KEY')!;
-  const supabaseServiceKey = Deno.env.get('SUPABASE_SERVICE_ROLE_KEY')!;
-  const openaiKey = Deno.env.get('OPENAI_API_KEY');
+  if (!OPENAI_API_KEY) return json({ error: 'openai_api_key_not_set' }, 500);
 
-  if (!openaiKey) return json({ error: 'openai_api_key_not_set' }, 500);
-
-  const supabase = createClient(supabaseUrl, supabaseAnonKey, {
+  const supabase = createClient(SUPABASE_URL, SUPABASE_ANON_KEY, {
     global: { headers: { Authorization: `Bearer ${jwt}` } },
     auth: { autoRefreshToken: false, persistSession: false },
   });
-  const supabaseAdmin = createClient(supabaseUrl, supabaseServiceKey, {
-    auth: { autoRefreshToken: false, persistSession: false },
-  });
+  const supabaseAdmin = getSupabaseAdmin();
 
   const { data: { user } } = await supabase.auth.getUser();
   if (!user) return json({ error: 'invalid_jwt' }, 401);
+  lap('auth');
 
   let body: ChatBody;
   try { body = await req.json(); }
@@ -83,6 +120,21 @@ serve(async (req: Request) => {
     const allowed = await agentDef.guard({ supabase, supabaseAdmin, tenantId, userId: user.id });
     if (!allowed) return json({ error: 'agent_access_denied', agent: agentDef.slug }, 403);
   }
+  lap('tenant');
+
+  // Last N turns as history (user + assistant only — skip tool noise).
+  // For an existing thread the read is independent of the quota check, so
+  // it is fired now and overlaps with it instead of running after it.
+  const loadHistory = (tid: string) => supabaseAdmin
+    .from('aurora_messages')
+    .select('role, text')
+    .eq('thread_id', tid)
+    .in('role', ['user', 'assistant'])
+    .order('created_at', { ascending: false })
+    .limit(HISTORY_TURNS * 2)
+    .then((r: any) => r);
+  let threadId = body.thread_id;
+  const earlyHistory = threadId ? loadHistory(threadId) : null;
 
   // Daily quota — soft limit per user (counts user messages in last 24h)
   const { data: userThreads } = await supabaseAdmin
@@ -99,49 +151,63 @@ serve(async (req: Request) => {
       return json({ error: 'daily_quota_exceeded', quota: DAILY_QUOTA_PER_USER }, 429);
     }
   }
+  lap('quota');
 
   // Resolve / create thread
-  let threadId = body.thread_id;
   if (!threadId) {
     const { data: tid, error: tidErr } = await supabase.rpc('aurora_get_or_create_thread', { p_agent_slug: agentDef.slug });
     if (tidErr) return json({ error: 'thread_create_failed', detail: tidErr.message }, 500);
     threadId = tid as string;
   }
 
-  // Load last N turns as history (user + assistant only — skip tool noise)
-  const { data: hist } = await supabaseAdmin
-    .from('aurora_messages')
-    .select('role, text')
-    .eq('thread_id', threadId)
-    .in('role', ['user', 'assistant'])
-    .order('created_at', { ascending: false })
-    .limit(HISTORY_TURNS * 2);
+  const { data: hist } = await (earlyHistory ?? loadHistory(threadId));
   const history = (hist || [])
     .reverse()
     .filter((m: any) => m.text)
-    .map((m: any) => ({ role: m.role === 'assistant' ? 'assistant' : 'user', content: m.text }));
-
-  // Persist user message FIRST (so it appears even if the model fails)
-  await supabaseAdmin.from('aurora_messages').insert({
+    .map((m: any) => ({
+      role: m.role === 'assistant' ? 'assistant' : 'user',
+      content: m.text.length > HISTORY_MESSAGE_CHARS ? m.text.slice(0, HISTORY_MESSAGE_CHARS) + '…' : m.text,
+    }));
+  lap('history');
+
+  // Persist user message FIRST (so it appears even if the model fails).
+  // The insert is kicked off here but only awaited after the model call —
+  // it's a DB round-trip that doesn't need to sit on the critical path.
+  // Query builders are lazy thenables, so .then() is what actually fires it.
+  const userInsert = supabaseAdmin.from('aurora_messages').insert({
     thread_id: threadId,
     role: 'user',
     text: body.message,
-  });
-
-  // Run the agent
-  const openai = new OpenAI({ apiKey: openaiKey });
-  let result;
-  try {
-    result = await runAgent({
-      openai, agentDef,
-      userMessage: body.message,
-      history,
-      ctx: { supabase, supabaseAdmin, tenantId, userId: user.id },
-    });
-  } catch (e: any) {
-    return json({ error: 'agent_run_failed', detail: e?.message }, 500);
+  }).then((r: any) => r);
+
+  // Run the agent (Atlas small talk and repeated routes skip the model)
+  // The shared route cache is only safe for a thread's opening turn: with
+  // history, Atlas may route a follow-up off the previous exchange.
+  const isRouter = agentDef.slug === 'atlas';
+  const useRouteCache = isRouter && history.length === 0;
+  let result = isRouter
+    ? (smallTalkReply(body.message) || (useRouteCache ? getCachedRoute(body.message) : null))
+    : null;
+  if (!result) {
+    try {
+      result = await runAgent({
+        openai: getOpenAI(OPENAI_API_KEY), agentDef,
+        userMessage: body.message,
+        history,
+        ctx: { supabase, supabaseAdmin, tenantId, userId: user.id },
+      });
+    } catch (e: any) {
+      await userInsert;
+      return json({ error: 'agent_run_failed', detail: e?.message }, 500);
+    }
+    if (useRouteCache) rememberRoute(body.message, result);
   }
+  lap('agent');
 
+  // The user row must land before the assistant row so created_at keeps
+  // the turn order. aurora_threads.last_message_at follows each insert via
+  // the trg_aurora_messages_touch_thread trigger.
+  await userInsert;
   // Persist assistant message + cost telemetry
   await supabaseAdmin.from('aurora_messages').insert({
     thread_id: threadId,
@@ -154,9 +220,8 @@ serve(async (req: Request) => {
     model: result.model,
     cost_usd: result.cost_usd,
   });
-
-  // Update thread last_message_at
-  await supabaseAdmin.from('aurora_threads').update({ last_message_at: new Date().toISOString() }).eq('id', threadId);
+  lap('persist');
+  if (spans) console.log('[aurora-chat] timing', JSON.stringify({ agent: agentDef.slug, ...spans }));
 
   return json({
     agent: agentDef.slug,
@@ -165,7 +230,7 @@ serve(async (req: Request) => {
     request_id: crypto.randomUUID(),
     thread_id: threadId,
     cost_usd: result.cost_usd,
-    tokens: { in: result.tokens_in, out: result.tokens_out },
+    tokens: { in: result.tokens_in, out: result.tokens_out, cached: result.tokens_cached },
   }, 200);
 });
 
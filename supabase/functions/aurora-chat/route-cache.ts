@@ -0,0 +1,109 @@
+// @ts-nocheck
+// Route cache — remembers Atlas routing decisions per isolate.
+//
+// Atlas (the router agent) has no tools and answers "cómo viene el
+// cashflow" with the same route → marina every time, for every tenant.
+// Caching the decision by normalized utterance skips the OpenAI round-trip
+// for repeated questions. The cache is shared across users and tenants, so
+// only context-free decisions go in:
+//   - the caller only consults it for a thread's first turn (no history),
+//     since Atlas routes follow-ups like "sí" / "el primero" off the prior turn;
+//   - utterances under MIN_WORDS are never cached, even as first turns;
+//   - only the target agent is stored, and the reply is rebuilt from it, so
+//     no caller's model-written text/reason is replayed to someone else;
+//   - text replies (clarifications, small talk, the admin-only refusal) and
+//     routes to pulse stay uncached.
+//
+// Bare greetings and thanks never reach the model at all: Atlas' own rules
+// say to answer small talk briefly without routing, so a canned reply is
+// exactly what the LLM would have produced.
+
+import type { RunResult } from './runner.ts';
+
+const TTL_MS = 60 * 60 * 1000;
+const MAX_ENTRIES = 500;
+const MIN_WORDS = 3;
+const UNCACHEABLE_TARGETS = new Set(['pulse']);
+
+const routes = new Map<string, { targetAgent: string; expiresAt: number }>();
+
+/** Lower-case, strip accents, collapse whitespace and drop edge punctuation. */
+export function normalizeUtterance(text: string): string {
+  return text
+    .toLowerCase()
+    .normalize('NFD')
+    .replace(/[\u0300-\u036f]/g, '')
+    .replace(/\s+/g, ' ')
+    .replace(/^[\s¿¡.,!?]+|[\s.,!?]+$/g, '');
+}
+
+// Matched against the normalized utterance, so accents/punctuation are gone.
+const SMALL_TALK: Array<[RegExp, string]> = [
+  [/^(?:hola|buenas|buen dia|buenos dias|buenas tardes|buenas noches|hey|hi|hello|que tal|como va)(?: atlas)?$/,
+    'Hola. Contame qué necesitás y te derivo al agente indicado.'],
+  [/^(?:gracias|muchas gracias|genial gracias|ok gracias|thanks|thank you)(?: atlas)?$/,
+    'De nada. Si necesitás algo más, preguntame.'],
+];
+
+function cannedResult(text: string, canvas: any, model: string): RunResult {
+  return {
+    text,
+    canvas,
+    tokens_in: 0,
+    tokens_out: 0,
+    tokens_cached: 0,
+    model,
+    cost_usd: 0,
+    trace: [],
+  };
+}
+
+/** Canned Atlas reply for bare greetings/thanks, or null to run the model. */
+export function smallTalkReply(message: string): RunResult | null {
+  const key = normalizeUtterance(message);
+  for (const [pattern, reply] of SMALL_TALK) {
+    if (pattern.test(key)) return cannedResult(reply, null, 'small-talk');
+  }
+  return null;
+}
+
+/** Cache key for an utterance, or null when it is too short to route on its own. */
+function routeKey(message: string): string | null {
+  const key = normalizeUtterance(message);
+  return key.split(' ').length >= MIN_WORDS ? key : null;
+}
+
+function routedResult(targetAgent: string): RunResult {
+  return cannedResult(
+    `Te derivo a ${targetAgent}.`,
+    { type: 'route', target_agent: targetAgent },
+    'route-cache',
+  );
+}
+
+/** Only valid for a thread's first turn — callers must not use it with history. */
+export function getCachedRoute(message: string): RunResult | null {
+  const key = routeKey(message);
+  if (!key) return null;
+  const hit = routes.get(key);
+  if (!hit) return null;
+  if (hit.expiresAt < Date.now()) {
+    routes.delete(key);
+    return null;
+  }
+  return routedResult(hit.targetAgent);
+}
+
+/** Only call for a thread's first turn — a route taken with history is contextual. */
+export function rememberRoute(message: string, result: RunResult): void {
+  const canvas = result.canvas;
+  if (canvas?.type !== 'route' || typeof canvas.target_agent !== 'string') return;
+  if (UNCACHEABLE_TARGETS.has(canvas.target_agent)) return;
+  const key = routeKey(message);
+  if (!key) return;
+  // Map keeps insertion order, so the first key is the oldest entry.
+  if (routes.size >= MAX_ENTRIES && !routes.has(key)) {
+    routes.delete(routes.keys().next().value);
+  }
+  routes.set(key, { targetAgent: canvas.target_agent, expiresAt: Date.now() + TTL_MS });
+}
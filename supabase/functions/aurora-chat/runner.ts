@@ -5,7 +5,8 @@
 //   1. Send messages + tools to OpenAI
 //   2. If the model wants tools, execute them in parallel (RLS-scoped client)
 //   3. Append tool results to messages
-//   4. Loop back; on iteration MAX-1, force structured output (AgentResponse)
+//   4. Loop back. Every pass requests structured output (AgentResponse), so
+//      the first pass without tool calls is already the final answer.
 //
 // Returns AgentResponse + cost telemetry.
 
@@ -14,18 +15,22 @@ import type { AgentDef, AgentResponseLite, ToolContext } from './types.ts';
 
 const MAX_TOOL_LOOPS = 6;
 
-// OpenAI gpt-4o pricing (input $2.50/M, output $10/M).
-// gpt-4o-mini pricing (input $0.15/M, output $0.60/M).
-function costUsd(model: string, tokensIn: number, tokensOut: number): number {
+// OpenAI gpt-4o pricing (input $2.50/M, cached input $1.25/M, output $10/M).
+// gpt-4o-mini pricing (input $0.15/M, cached input $0.075/M, output $0.60/M).
+// tokensIn includes tokensCached — OpenAI reports cached tokens as a subset.
+function costUsd(model: string, tokensIn: number, tokensOut: number, tokensCached = 0): number {
+  const fresh = tokensIn - tokensCached;
   if (model.includes('mini')) {
-    return (tokensIn * 0.15 + tokensOut * 0.60) / 1_000_000;
+    return (fresh * 0.15 + tokensCached * 0.075 + tokensOut * 0.60) / 1_000_000;
   }
-  return (tokensIn * 2.50 + tokensOut * 10.0) / 1_000_000;
+  return (fresh * 2.50 + tokensCached * 1.25 + tokensOut * 10.0) / 1_000_000;
 }
 
 export interface RunResult extends AgentResponseLite {
   tokens_in: number;
   tokens_out: number;
+  /** Prompt tokens served from OpenAI's prefix cache (subset of tokens_in). */
+  tokens_cached: number;
   model: string;
   cost_usd: number;
   /** History of messages produced this turn (assistant + tool results). For persistence. */
@@ -54,6 +59,7 @@ export async function runAgent({
   const trace: any[] = [];
   let tokensIn = 0;
   let tokensOut = 0;
+  let tokensCached = 0;
 
   for (let i = 0; i < MAX_TOOL_LOOPS; i++) {
     const isLastLoop = i === MAX_TOOL_LOOPS - 1;
@@ -63,46 +69,30 @@ export async function runAgent({
       messages,
       tools: agentDef.tools.length > 0 ? agentDef.tools : undefined,
       tool_choice: agentDef.tools.length > 0 && !isLastLoop ? 'auto' : 'none',
-      // Force structured JSON when the model has no more tool calls to make.
-      // We do this on the last iteration unconditionally, and on any earlier
-      // iteration where the model produced no tool calls (handled below by
-      // re-issuing the request with tool_choice='none' if needed).
-      response_format: isLastLoop
-        ? {
-            type: 'json_schema',
-            json_schema: { name: 'AgentResponse', schema: AGENT_RESPONSE_SCHEMA, strict: true },
-          }
-        : undefined,
+      // Structured JSON is requested on every pass, alongside the tools.
+      // When the model has nothing left to call it answers straight in the
+      // AgentResponse shape — no separate "force JSON" round-trip needed.
+      response_format: {
+        type: 'json_schema',
+        json_schema: { name: 'AgentResponse', schema: AGENT_RESPONSE_SCHEMA, strict: true },
+      },
+      // OpenAI caches the static prefix (tools + system prompt) automatically
+      // once it passes 1024 tokens. Keying by agent routes every turn of the
+      // same agent — and every pass of this loop — to the same cache shard.
+      prompt_cache_key: `aurora:${agentDef.slug}`,
     });
 
     tokensIn  += completion.usage?.prompt_tokens     ?? 0;
     tokensOut += completion.usage?.completion_tokens ?? 0;
+    tokensCached += completion.usage?.prompt_tokens_details?.cached_tokens ?? 0;
 
     const msg = completion.choices[0].message;
     messages.push(msg);
     trace.push(msg);
 
-    // No tool calls → either we got the final JSON (if isLastLoop) or we need
-    // one more pass to force JSON output.
+    // No tool calls → this is the final JSON.
     if (!msg.tool_calls || msg.tool_calls.length === 0) {
-      if (isLastLoop) {
-        // Final JSON — parse + return
-        return parseAndReturn(msg.content, tokensIn, tokensOut, agentDef.model, trace);
-      }
-      // Force one more pass with JSON schema enforcement
-      const finalCompletion = await openai.chat.completions.create({
-        model: agentDef.model,
-        messages,
-        response_format: {
-          type: 'json_schema',
-          json_schema: { name: 'AgentResponse', schema: AGENT_RESPONSE_SCHEMA, strict: true },
-        },
-      });
-      tokensIn  += finalCompletion.usage?.prompt_tokens     ?? 0;
-      tokensOut += finalCompletion.usage?.completion_tokens ?? 0;
-      const finalMsg = finalCompletion.choices[0].message;
-      trace.push(finalMsg);
-      return parseAndReturn(finalMsg.content, tokensIn, tokensOut, agentDef.model, trace);
+      return parseAndReturn(msg.content, tokensIn, tokensOut, tokensCached, agentDef.model, trace);
     }
 
     // Execute tools in parallel — OpenAI supports parallel function calling.
@@ -112,15 +102,19 @@ export async function runAgent({
         if (!fn) {
           return { tool_call_id: tc.id, role: 'tool', content: JSON.stringify({ error: 'tool_not_found', name: tc.function.name }) };
         }
+        let timer: number | undefined;
         try {
           const args = JSON.parse(tc.function.arguments || '{}');
           const result = await Promise.race([
             fn(args, ctx),
-            new Promise((_, reject) => setTimeout(() => reject(new Error('tool_timeout_5s')), 5000)),
+            new Promise((_, reject) => { timer = setTimeout(() => reject(new Error('tool_timeout_5s')), 5000); }),
           ]);
           return { tool_call_id: tc.id, role: 'tool', content: JSON.stringify(result ?? null) };
         } catch (e: any) {
           return { tool_call_id: tc.id, role: 'tool', content: JSON.stringify({ error: e?.message || 'tool_failed' }) };
+        } finally {
+          // Don't leave a 5s timer pending on the isolate after a fast tool.
+          clearTimeout(timer);
         }
       }),
     );
@@ -134,13 +128,14 @@ export async function runAgent({
     canvas: null,
     tokens_in: tokensIn,
     tokens_out: tokensOut,
+    tokens_cached: tokensCached,
     model: agentDef.model,
-    cost_usd: costUsd(agentDef.model, tokensIn, tokensOut),
+    cost_usd: costUsd(agentDef.model, tokensIn, tokensOut, tokensCached),
     trace,
   };
 }
 
-function parseAndReturn(content: string, tokensIn: number, tokensOut: number, model: string, trace: any[]): RunResult {
+function parseAndReturn(content: string, tokensIn: number, tokensOut: number, tokensCached: number, model: string, trace: any[]): RunResult {
   let parsed: any = { text: '', canvas: null };
   try {
     parsed = JSON.parse(content || '{}');
@@ -152,8 +147,9 @@ function parseAndReturn(content: string, tokensIn: number, tokensOut: number, mo
     canvas: parsed.canvas ?? null,
     tokens_in: tokensIn,
     tokens_out: tokensOut,
+    tokens_cached: tokensCached,
     model,
-    cost_usd: costUsd(model, tokensIn, tokensOut),
+    cost_usd: costUsd(model, tokensIn, tokensOut, tokensCached),
     trace,
   };
 }
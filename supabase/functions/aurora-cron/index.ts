@@ -22,6 +22,9 @@ interface CronTrigger {
   next_run_at: string;
 }
 
+// Max agent runs in flight per tick (a tick picks up at most 20 triggers).
+const CRON_CONCURRENCY = 4;
+
 // Very simple cron-to-next-run estimator. We don't parse the full cron syntax —
 // just bump next_run_at by the most common intervals encoded in `schedule`.
 // pg_cron stays the source of truth for the actual firing schedule.
@@ -45,6 +48,13 @@ function nextRunFromSchedule(schedule: string): Date {
   return next;
 }
 
+// Shared across cron ticks that land on the same warm isolate.
+let openaiClient: OpenAI | null = null;
+function getOpenAI(apiKey: string): OpenAI {
+  if (!openaiClient) openaiClient = new OpenAI({ apiKey });
+  return openaiClient;
+}
+
 serve(async (req: Request) => {
   // Authz: cron secret OR service role JWT
   const authHeader = req.headers.get('Authorization') || '';
@@ -74,13 +84,13 @@ serve(async (req: Request) => {
     return jsonResp({ ok: true, ran: 0 });
   }
 
-  const openai = new OpenAI({ apiKey: openaiKey });
+  const openai = getOpenAI(openaiKey);
   let ran = 0;
   const errors: any[] = [];
 
-  for (const trig of (due as CronTrigger[])) {
+  const runTrigger = async (trig: CronTrigger) => {
     const agentDef = AGENTS[trig.agent_slug];
-    if (!agentDef || !trig.user_id) continue;
+    if (!agentDef || !trig.user_id) return;
 
     try {
       // Build a per-user supabase client so RLS scopes the tools to that user's data.
@@ -110,7 +120,7 @@ serve(async (req: Request) => {
           threadId = newT?.id || null;
         }
       }
-      if (!threadId) { errors.push({ trigger_id: trig.id, error: 'thread_create_failed' }); continue; }
+      if (!threadId) { errors.push({ trigger_id: trig.id, error: 'thread_create_failed' }); return; }
 
       // Insert the user-facing "trigger" message so the dock shows the prompt context
       await sbAdmin.from('aurora_messages').insert({
@@ -127,49 +137,69 @@ serve(async (req: Request) => {
         ctx: { supabase: sbUser, supabaseAdmin: sbAdmin, tenantId: trig.tenant_id, userId: trig.user_id },
       });
 
-      // Persist the assistant response
-      await sbAdmin.from('aurora_messages').insert({
-        thread_id: threadId,
-        role: 'assistant',
-        agent_slug: agentDef.slug,
-        text: result.text,
-        canvas: result.canvas,
-        tokens_in: result.tokens_in,
-        tokens_out: result.tokens_out,
-        model: result.model,
-        cost_usd: result.cost_usd,
-      });
-
-      // Update the thread last_message_at
-      await sbAdmin.from('aurora_threads').update({ last_message_at: new Date().toISOString() }).eq('id', threadId);
-
-      // Fire an in-app notification so the user sees the proactive thread
-      await sbAdmin.from('notifications').insert({
-        user_id: trig.user_id,
-        tenant_id: trig.tenant_id,
-        type: 'system',
-        priority: 'medium',
-        category: 'aurora_trigger',
-        title: agentDef.slug.charAt(0).toUpperCase() + agentDef.slug.slice(1) + ' tiene algo para vos',
-        message: result.text?.slice(0, 140) || 'Abrí Aurora para ver el detalle.',
-        link: '/home',
-        action_required: false,
-        action_url: '/home',
-        action_text: 'Abrir Aurora',
-        metadata: { agent_slug: agentDef.slug, thread_id: threadId, trigger_id: trig.id },
-      });
-
-      // Update the trigger schedule
-      await sbAdmin.from('aurora_triggers').update({
-        last_run_at: new Date().toISOString(),
-        next_run_at: nextRunFromSchedule(trig.schedule).toISOString(),
-      }).eq('id', trig.id);
+      // The assistant row, the notification and the schedule bump don't
+      // depend on each other — write them in one round-trip.
+      await Promise.all([
+        // Persist the assistant response
+        sbAdmin.from('aurora_messages').insert({
+          thread_id: threadId,
+          role: 'assistant',
+          agent_slug: agentDef.slug,
+          text: result.text,
+          canvas: result.canvas,
+          tokens_in: result.tokens_in,
+          tokens_out: result.tokens_out,
+          model: result.model,
+          cost_usd: result.cost_usd,
+        }),
+        // Fire an in-app notification so the user sees the proactive thread
+        sbAdmin.from('notifications').insert({
+          user_id: trig.user_id,
+          tenant_id: trig.tenant_id,
+          type: 'system',
+          priority: 'medium',
+          category: 'aurora_trigger',
+          title: agentDef.slug.charAt(0).toUpperCase() + agentDef.slug.slice(1) + ' tiene algo para vos',
+          message: result.text?.slice(0, 140) || 'Abrí Aurora para ver el detalle.',
+          link: '/home',
+          action_required: false,
+          action_url: '/home',
+          action_text: 'Abrir Aurora',
+          metadata: { agent_slug: agentDef.slug, thread_id: threadId, trigger_id: trig.id },
+        }),
+        // Update the trigger schedule
+        sbAdmin.from('aurora_triggers').update({
+          last_run_at: new Date().toISOString(),
+          next_run_at: nextRunFromSchedule(trig.schedule).toISOString(),
+        }).eq('id', trig.id),
+      ]);
 
       ran += 1;
     } catch (e: any) {
       errors.push({ trigger_id: trig.id, error: e?.message });
     }
+  };
+
+  // Agent runs are dominated by OpenAI latency, so a small worker pool
+  // overlaps them instead of paying N round-trips back to back. Capped to
+  // stay well inside the OpenAI rate limit. Triggers that share a thread
+  // (same user + agent) stay in one group and run in order, so two runs
+  // never race the get-or-create lookup or interleave their messages.
+  const groups = new Map<string, CronTrigger[]>();
+  for (const trig of due as CronTrigger[]) {
+    const key = `${trig.user_id}:${trig.agent_slug}`;
+    const group = groups.get(key);
+    if (group) group.push(trig);
+    else groups.set(key, [trig]);
   }
+  const queue = [...groups.values()];
+  await Promise.all(
+    Array.from({ length: Math.min(CRON_CONCURRENCY, queue.length) }, async () => {
+      for (let group = queue.shift(); group; group = queue.shift()) {
+        for (const trig of group) await runTrigger(trig);
+      }
+    }),
+  );
 
   return jsonResp({ ok: true, ran, errors });
 });
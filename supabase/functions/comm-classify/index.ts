@@ -21,7 +21,8 @@
 // verify_jwt=false porque lo invoca trigger Postgres via pg_net y scripts de backfill.
 
 import { serve } from 'https://deno.land/std@0.224.0/http/server.ts'
-import { createClient, SupabaseClient } from 'https://esm.sh/@supabase/supabase-js@2'
+import type { SupabaseClient } from 'https://esm.sh/@supabase/supabase-js@2'
+import { adminClient } from '../_shared/comm-utils.ts'
 
 const ALLOWED_ORIGINS = (Deno.env.get('ALLOWED_ORIGINS') || '')
   .split(',').map((s) => s.trim()).filter(Boolean)
@@ -57,12 +58,6 @@ function deriveConfidence(result: any): number {
   return Math.min(0.95, +score.toFixed(2))
 }
 
-function adminClient(): SupabaseClient {
-  return createClient(SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY, {
-    auth: { persistSession: false, autoRefreshToken: false },
-  })
-}
-
 serve(async (req) => {
   if (req.method === 'OPTIONS') return new Response(null, { headers: cors })
   if (req.method !== 'POST') {
@@ -158,34 +153,15 @@ async function classify(admin: SupabaseClient, messageId: string) {
     return { ok: false, skipped: 'circuit_breaker_active', recent_failures: failureCount }
   }
 
-  const { data: tenantRow } = await admin
-    .from('tenants').select('name').eq('id', msg.tenant_id).maybeSingle()
-  const { data: clientsList } = await admin
-    .from('clients').select('id, name, email, company').eq('tenant_id', msg.tenant_id).limit(100)
-  const { data: projectsList } = await admin
-    .from('projects').select('id, title, client_id, clients(name)').eq('tenant_id', msg.tenant_id).limit(100)
-
-  // Pull thread context from DB if missing — esto resuelve el caso del
-  // mensaje "este también asap" donde el classifier no sabe qué es "este"
-  // porque thread_context viene vacío en muchos mensajes que vienen via
-  // slack-events sin batch context.
-  let threadCtx: any[] = Array.isArray(msg.thread_context) ? msg.thread_context : []
-  if (threadCtx.length === 0 && msg.thread_id) {
-    const { data: priorMsgs } = await admin
-      .from('communication_messages')
-      .select('from_name, body_text, received_at')
-      .eq('tenant_id', msg.tenant_id)
-      .eq('thread_id', msg.thread_id)
-      .neq('id', msg.id)
-      .lte('received_at', msg.received_at || new Date().toISOString())
-      .order('received_at', { ascending: true })
-      .limit(8)
-    threadCtx = (priorMsgs || []).map((m: any) => ({
-      from: m.from_name || 'unknown',
-      body: (m.body_text || '').slice(0, 400),
-      date: m.received_at,
-    }))
-  }
+  // Tenant, clients, projects and thread context only depend on `msg` —
+  // fan them out instead of paying four sequential round-trips before the
+  // classifier call.
+  const [{ data: tenantRow }, { data: clientsList }, { data: projectsList }, threadCtx] = await Promise.all([
+    admin.from('tenants').select('name, owner_id').eq('id', msg.tenant_id).maybeSingle(),
+    admin.from('clients').select('id, name, email, company').eq('tenant_id', msg.tenant_id).limit(100),
+    admin.from('projects').select('id, title, client_id, clients(name)').eq('tenant_id', msg.tenant_id).limit(100),
+    loadThreadContext(admin, msg),
+  ])
 
   const classifyInput = {
     platform: msg.platform,
@@ -252,15 +228,26 @@ async function classify(admin: SupabaseClient, messageId: string) {
     ai_processed: true,
     ai_classification: result,
   }
+  // The classifier picks ids from the tenant-scoped lists loaded above, so
+  // membership there already proves ownership. Only ids outside those
+  // (capped) lists need a tenant-checked lookup.
   if (result.matched_client_id) {
-    const { data: c } = await admin.from('clients')
-      .select('id').eq('id', result.matched_client_id).eq('tenant_id', msg.tenant_id).maybeSingle()
-    if (c) updates.matched_client_id = result.matched_client_id
+    if ((clientsList || []).some((c: any) => c.id === result.matched_client_id)) {
+      updates.matched_client_id = result.matched_client_id
+    } else {
+      const { data: c } = await admin.from('clients')
+        .select('id').eq('id', result.matched_client_id).eq('tenant_id', msg.tenant_id).maybeSingle()
+      if (c) updates.matched_client_id = result.matched_client_id
+    }
   }
   if (result.matched_project_id && !msg.matched_project_id) {
-    const { data: p } = await admin.from('projects')
-      .select('id').eq('id', result.matched_project_id).eq('tenant_id', msg.tenant_id).maybeSingle()
-    if (p) updates.matched_project_id = result.matched_project_id
+    if ((projectsList || []).some((p: any) => p.id === result.matched_project_id)) {
+      updates.matched_project_id = result.matched_project_id
+    } else {
+      const { data: p } = await admin.from('projects')
+        .select('id').eq('id', result.matched_project_id).eq('tenant_id', msg.tenant_id).maybeSingle()
+      if (p) updates.matched_project_id = result.matched_project_id
+    }
   }
 
   await admin.from('communication_messages').update(updates).eq('id', messageId)
@@ -268,9 +255,10 @@ async function classify(admin: SupabaseClient, messageId: string) {
   const shouldTask = !!result.should_create_task && !!result.suggested_task?.title
   const finalProjectId = updates.matched_project_id || msg.matched_project_id || null
   const finalClientId = updates.matched_client_id || null
+  const ownerId: string | null = tenantRow?.owner_id || null
 
   if (shouldTask && mode === 'classify_and_auto_create' && confidence >= AUTO_CREATE_THRESHOLD) {
-    const taskId = await createTaskFromMessage(admin, msg, result, finalClientId, finalProjectId)
+    const taskId = await createTaskFromMessage(admin, msg, result, finalClientId, finalProjectId, ownerId)
     if (taskId) {
       await admin.from('communication_messages')
         .update({ task_id: taskId, status: 'auto_resolved' }).eq('id', messageId)
@@ -279,23 +267,43 @@ async function classify(admin: SupabaseClient, messageId: string) {
   }
 
   if (shouldTask && confidence >= PROPOSE_THRESHOLD) {
-    await createProposalNotification(admin, msg, result, finalClientId, finalProjectId, confidence)
+    await createProposalNotification(admin, msg, result, finalClientId, finalProjectId, confidence, ownerId)
     return { ok: true, action: 'proposal_notified', confidence, intent: result.intent }
   }
 
   return { ok: true, action: 'classified_no_action', confidence, intent: result.intent }
 }
 
+// Pull thread context from DB if missing — esto resuelve el caso del
+// mensaje "este también asap" donde el classifier no sabe qué es "este"
+// porque thread_context viene vacío en muchos mensajes que vienen via
+// slack-events sin batch context.
+async function loadThreadContext(admin: SupabaseClient, msg: any): Promise<any[]> {
+  if (Array.isArray(msg.thread_context) && msg.thread_context.length > 0) return msg.thread_context
+  if (!msg.thread_id) return []
+  const { data: priorMsgs } = await admin
+    .from('communication_messages')
+    .select('from_name, body_text, received_at')
+    .eq('tenant_id', msg.tenant_id)
+    .eq('thread_id', msg.thread_id)
+    .neq('id', msg.id)
+    .lte('received_at', msg.received_at || new Date().toISOString())
+    .order('received_at', { ascending: true })
+    .limit(8)
+  return (priorMsgs || []).map((m: any) => ({
+    from: m.from_name || 'unknown',
+    body: (m.body_text || '').slice(0, 400),
+    date: m.received_at,
+  }))
+}
+
 async function createTaskFromMessage(
   admin: SupabaseClient, msg: any, result: any,
-  clientId: string | null, projectId: string | null,
+  clientId: string | null, projectId: string | null, ownerId: string | null,
 ): Promise<string | null> {
   const sug = result.suggested_task
   if (!sug?.title) return null
 
-  const { data: tenant } = await admin
-    .from('tenants').select('owner_id').eq('id', msg.tenant_id).maybeSingle()
-  const ownerId = tenant?.owner_id
   if (!ownerId) {
     console.warn('[comm-classify] no tenant owner for', msg.tenant_id)
     return null
@@ -336,11 +344,8 @@ async function createTaskFromMessage(
 
 async function createProposalNotification(
   admin: SupabaseClient, msg: any, result: any,
-  clientId: string | null, projectId: string | null, confidence: number,
+  clientId: string | null, projectId: string | null, confidence: number, ownerId: string | null,
 ) {
-  const { data: tenant } = await admin
-    .from('tenants').select('owner_id').eq('id', msg.tenant_id).maybeSingle()
-  const ownerId = tenant?.owner_id
   if (!ownerId) return
 
   const sug = result.suggested_task
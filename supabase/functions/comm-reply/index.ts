@@ -52,7 +52,13 @@ function buildRfc2822(args: {
 
 const b64url = (str: string): string => {
   const bytes = new TextEncoder().encode(str)
-  return btoa(String.fromCharCode(...bytes)).replace(/\+/g, '-').replace(/\//g, '_').replace(/=+$/, '')
+  // Spreading every byte as an argument overflows the call stack on long
+  // replies (quoted threads); convert in 32KB slices instead.
+  let binary = ''
+  for (let i = 0; i < bytes.length; i += 0x8000) {
+    binary += String.fromCharCode.apply(null, bytes.subarray(i, i + 0x8000) as unknown as number[])
+  }
+  return btoa(binary).replace(/\+/g, '-').replace(/\//g, '_').replace(/=+$/, '')
 }
 
 async function sendGmail(accessToken: string, opts: {
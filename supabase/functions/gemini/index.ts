@@ -11,14 +11,26 @@ const corsHeaders = {
   'Access-Control-Allow-Origin': allowedOrigin,
   'Access-Control-Allow-Headers': 'authorization, x-client-info, x-custom-version, apikey, content-type',
 }
+// Every JSON response carries the same headers; build the object once.
+const jsonHeaders = Object.freeze({ ...corsHeaders, 'Content-Type': 'application/json' })
 
 const DAILY_QUOTA = 200 // max AI calls per tenant per day (safe with paid tier ~$0.002/call)
+// Happy-path trace logs (prompt sizes, finish reasons, truncation) are only
+// emitted with AI_DEBUG=1. Errors and retries are always logged.
+const AI_DEBUG = Deno.env.get('AI_DEBUG') === '1'
 
+// The service-role client holds no per-user state, so one instance per
+// isolate is reused by every warm request instead of rebuilt each time.
+let supabaseAdminClient: ReturnType<typeof createClient> | null = null
 function getSupabaseAdmin() {
-  return createClient(
-    Deno.env.get('SUPABASE_URL')!,
-    Deno.env.get('SUPABASE_SERVICE_ROLE_KEY')!
-  )
+  if (!supabaseAdminClient) {
+    supabaseAdminClient = createClient(
+      Deno.env.get('SUPABASE_URL')!,
+      Deno.env.get('SUPABASE_SERVICE_ROLE_KEY')!,
+      { auth: { autoRefreshToken: false, persistSession: false } },
+    )
+  }
+  return supabaseAdminClient
 }
 
 type TaskResponse = {
@@ -122,6 +134,58 @@ type FinanceBatchResponse = {
   summary?: string
 }
 
+// ─── Per-type generation settings (types not listed use the defaults) ──
+const MAX_TOKENS_BY_TYPE: Record<string, number> = {
+  project_architect: 4000,
+  proposal: 2400,
+  blog: 2400,
+  tasks_bulk: 4500,
+  plan_period: 16384,
+  weekly_summary: 1600,
+  advisor: 2400,
+  advisor_chat: 1200,
+  advisor_chat_actions: 2400,
+  finance_chat: 1500,
+  standup: 4096,
+  finance_entry: 800,
+  finance_entries_batch: 12000,
+  content_strategy_suggest: 2400,
+  member_weekly_summary: 1200,
+  comm_classify: 1200,
+  comm_reply_compose: 1500,
+  train_brand_style: 3200,
+  generate_content: 2800,
+  generate_outreach: 2200,
+  generate_case_study: 2400,
+  suggest_content: 2400,
+  ad_generator: 2400,
+}
+const DEFAULT_MAX_TOKENS = 512
+
+const TEMPERATURE_BY_TYPE: Record<string, number> = {
+  tasks_bulk: 0.4,
+  plan_period: 0.4,
+  standup: 0.4,
+  weekly_summary: 0.5,
+  advisor: 0.6,
+  advisor_chat: 0.6,
+  advisor_chat_actions: 0.5,
+  finance_chat: 0.3,
+  finance_entry: 0,
+  finance_entries_batch: 0,
+  content_strategy_suggest: 0.7,
+  member_weekly_summary: 0.5,
+  comm_classify: 0.2,
+  comm_reply_compose: 0.4,
+  train_brand_style: 0.4,
+  generate_content: 0.75,
+  generate_outreach: 0.7,
+  generate_case_study: 0.55,
+  suggest_content: 0.8,
+  ad_generator: 0.75,
+}
+const DEFAULT_TEMPERATURE = 0.3
+
 // ─── Simple in-memory rate limiter (per edge function instance) ──
 const rateLimiter = new Map<string, { count: number; resetAt: number }>()
 const RATE_LIMIT = 10     // max requests per window
@@ -133,6 +197,44 @@ async function hashString(s: string): Promise<string> {
   return Array.from(new Uint8Array(buf)).map(b => b.toString(16).padStart(2, '0')).join('')
 }
 
+// ─── Embedding cache (per edge function instance) ──
+// Regenerate / retry sends the exact same input again; the embedding of a
+// given text never changes, so repeats are served from memory. Keyed by the
+// SHA-256 of the text actually embedded; Map order doubles as LRU order.
+const EMBED_MODEL = 'text-embedding-3-small'
+const EMBED_CACHE_MAX = 256
+const embeddingCache = new Map<string, number[]>()
+
+async function getEmbedding(apiKey: string, text: string): Promise<number[] | null> {
+  const input = text.slice(0, 8000)
+  const key = await hashString(input)
+  const cached = embeddingCache.get(key)
+  if (cached) {
+    embeddingCache.delete(key)
+    embeddingCache.set(key, cached)
+    return cached
+  }
+
+  const embedRes = await fetch('https://api.openai.com/v1/embeddings', {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json', 'Authorization': `Bearer ${apiKey}` },
+    body: JSON.stringify({ model: EMBED_MODEL, input }),
+  })
+  if (!embedRes.ok) {
+    console.log(`[ai] embedding skipped: status ${embedRes.status}`)
+    return null
+  }
+  const embedData = await embedRes.json()
+  const embedding = embedData?.data?.[0]?.embedding || null
+  if (embedding) {
+    if (embeddingCache.size >= EMBED_CACHE_MAX) {
+      embeddingCache.delete(embeddingCache.keys().next().value)
+    }
+    embeddingCache.set(key, embedding)
+  }
+  return embedding
+}
+
 function checkRateLimit(userId: string): boolean {
   const now = Date.now()
   const entry = rateLimiter.get(userId)
@@ -157,7 +259,7 @@ serve(async (req) => {
     if (!checkRateLimit(userKey)) {
       return new Response(JSON.stringify({ error: 'Rate limit exceeded. Please wait a moment before trying again.' }), {
         status: 429,
-        headers: { ...corsHeaders, 'Content-Type': 'application/json' },
+        headers: jsonHeaders,
       })
     }
 
@@ -189,7 +291,7 @@ serve(async (req) => {
       if (config?.features && config.features.ai_assistant === false) {
         return new Response(JSON.stringify({ error: 'AI no está habilitado para este equipo.' }), {
           status: 403,
-          headers: { ...corsHeaders, 'Content-Type': 'application/json' },
+          headers: jsonHeaders,
         })
       }
     }
@@ -205,7 +307,7 @@ serve(async (req) => {
       if ((count || 0) >= DAILY_QUOTA) {
         return new Response(JSON.stringify({ error: 'Límite diario de AI alcanzado. Intenta mañana.' }), {
           status: 429,
-          headers: { ...corsHeaders, 'Content-Type': 'application/json' },
+          headers: jsonHeaders,
         })
       }
     }
@@ -216,7 +318,7 @@ serve(async (req) => {
     if (!input || typeof input !== 'string') {
       return new Response(JSON.stringify({ error: 'Missing input' }), {
         status: 400,
-        headers: { ...corsHeaders, 'Content-Type': 'application/json' },
+        headers: jsonHeaders,
       })
     }
 
@@ -302,7 +404,7 @@ Use the profile above to personalize tone, language, and recommendations. The us
       }
       processedInput = filtered.join('\n')
       if (taskCount > 30) {
-        console.log(`[gemini] standup: truncated ${taskCount} tasks to 30`)
+        if (AI_DEBUG) console.log(`[gemini] standup: truncated ${taskCount} tasks to 30`)
       }
     } else if (type === 'plan_period') {
       const lines = input.split('\n')
@@ -327,7 +429,7 @@ Use the profile above to personalize tone, language, and recommendations. The us
       }
       processedInput = filtered.join('\n')
       if (taskCount > 20) {
-        console.log(`[gemini] plan_period: truncated ${taskCount} tasks to 20`)
+        if (AI_DEBUG) console.log(`[gemini] plan_period: truncated ${taskCount} tasks to 20`)
       }
     }
 
@@ -336,7 +438,7 @@ Use the profile above to personalize tone, language, and recommendations. The us
     if (!apiKey) {
       return new Response(JSON.stringify({ error: 'Missing OPENAI_API_KEY (or GEMINI_API_KEY as fallback)' }), {
         status: 500,
-        headers: { ...corsHeaders, 'Content-Type': 'application/json' },
+        headers: jsonHeaders,
       })
     }
 
@@ -349,17 +451,7 @@ Use the profile above to personalize tone, language, and recommendations. The us
     const RETRIEVAL_TYPES = new Set(['task', 'proposal', 'blog', 'weekly_summary', 'advisor', 'tasks_bulk'])
     if (useOpenAI && tenantId && RETRIEVAL_TYPES.has(type)) {
       try {
-        const embedRes = await fetch('https://api.openai.com/v1/embeddings', {
-          method: 'POST',
-          headers: { 'Content-Type': 'application/json', 'Authorization': `Bearer ${apiKey}` },
-          body: JSON.stringify({ model: 'text-embedding-3-small', input: processedInput.slice(0, 8000) }),
-        })
-        if (embedRes.ok) {
-          const embedData = await embedRes.json()
-          queryEmbedding = embedData?.data?.[0]?.embedding || null
-        } else {
-          console.log(`[ai] embedding skipped: status ${embedRes.status}`)
-        }
+        queryEmbedding = await getEmbedding(apiKey, processedInput)
       } catch (e) {
         console.log('[ai] embedding error:', String(e))
       }
@@ -386,7 +478,7 @@ ${examples}
 </PAST_EXAMPLES>
 
 `
-            console.log(`[ai] injected ${similar.length} few-shot examples for type=${type}`)
+            if (AI_DEBUG) console.log(`[ai] injected ${similar.length} few-shot examples for type=${type}`)
           }
         } catch (e) {
           console.log('[ai] retrieval error:', String(e))
@@ -396,7 +488,10 @@ ${examples}
 
     const baseSystemPrompt = buildSystemPrompt(type)
 
-    const systemPrompt = profileBlock + examplesBlock + baseSystemPrompt
+    // Most-stable first so provider prefix caching can reuse it: the base
+    // prompt is identical for every tenant of a given type, the profile
+    // changes per tenant, and the retrieved examples change per query.
+    const systemPrompt = [baseSystemPrompt, profileBlock, examplesBlock].filter(Boolean).join('\n\n').trimEnd()
 
     // Comm_classify: gpt-4o-mini was echoing the input verbatim when the user
     // content was a raw JSON object that looked structurally similar to the
@@ -407,12 +502,13 @@ ${examples}
       userContent = `Classify the following inbound message and return the classification object defined in the system prompt. Do NOT return the input fields; return only the classification schema (intent, summary, etc).\n\nMESSAGE PAYLOAD (JSON):\n${processedInput}`
     }
 
-    if (type === 'comm_classify') {
+    if (AI_DEBUG && type === 'comm_classify') {
       console.log(`[gemini] comm_classify systemPrompt len=${systemPrompt.length}, profile=${profileBlock.length}, examples=${examplesBlock.length}, base=${baseSystemPrompt.length}, userContent len=${userContent.length}`)
     }
 
-    const maxTokens = type === 'project_architect' ? 4000 : type === 'proposal' ? 2400 : type === 'blog' ? 2400 : type === 'tasks_bulk' ? 4500 : type === 'plan_period' ? 16384 : type === 'weekly_summary' ? 1600 : type === 'advisor' ? 2400 : type === 'advisor_chat' ? 1200 : type === 'advisor_chat_actions' ? 2400 : type === 'finance_chat' ? 1500 : type === 'standup' ? 4096 : type === 'finance_entry' ? 800 : type === 'finance_entries_batch' ? 12000 : type === 'content_strategy_suggest' ? 2400 : type === 'member_weekly_summary' ? 1200 : type === 'comm_classify' ? 1200 : type === 'comm_reply_compose' ? 1500 : type === 'train_brand_style' ? 3200 : type === 'generate_content' ? 2800 : type === 'generate_outreach' ? 2200 : type === 'generate_case_study' ? 2400 : type === 'suggest_content' ? 2400 : type === 'ad_generator' ? 2400 : 512
-    const temperature = type === 'tasks_bulk' || type === 'plan_period' || type === 'standup' ? 0.4 : type === 'weekly_summary' ? 0.5 : type === 'advisor' ? 0.6 : type === 'advisor_chat' ? 0.6 : type === 'advisor_chat_actions' ? 0.5 : type === 'finance_chat' ? 0.3 : type === 'finance_entry' || type === 'finance_entries_batch' ? 0 : type === 'content_strategy_suggest' ? 0.7 : type === 'member_weekly_summary' ? 0.5 : type === 'comm_classify' ? 0.2 : type === 'comm_reply_compose' ? 0.4 : type === 'train_brand_style' ? 0.4 : type === 'generate_content' ? 0.75 : type === 'generate_outreach' ? 0.7 : type === 'generate_case_study' ? 0.55 : type === 'suggest_content' ? 0.8 : type === 'ad_generator' ? 0.75 : 0.3
+    // hasOwn so a caller-supplied type like "constructor" can't hit Object.prototype
+    const maxTokens = Object.hasOwn(MAX_TOKENS_BY_TYPE, type) ? MAX_TOKENS_BY_TYPE[type] : DEFAULT_MAX_TOKENS
+    const temperature = Object.hasOwn(TEMPERATURE_BY_TYPE, type) ? TEMPERATURE_BY_TYPE[type] : DEFAULT_TEMPERATURE
 
     // ─── Request: OpenAI (preferred) or Gemini fallback ─────────────
     const MAX_RETRIES = 3
@@ -468,14 +564,14 @@ ${examples}
           : text || 'OpenAI request failed'
         return new Response(JSON.stringify({ error: userMessage }), {
           status: response!.status === 429 ? 429 : 500,
-          headers: { ...corsHeaders, 'Content-Type': 'application/json' },
+          headers: jsonHeaders,
         })
       }
 
       const data = await response!.json()
       rawText = data?.choices?.[0]?.message?.content || ''
       const finishReason = data?.choices?.[0]?.finish_reason || 'unknown'
-      console.log(`[ai] openai type=${type} finish=${finishReason} len=${rawText.length}`)
+      if (AI_DEBUG) console.log(`[ai] openai type=${type} finish=${finishReason} len=${rawText.length}`)
 
       // Save usage for logging (remapped to Gemini-style fields further down)
       ;(response as any)._usage = {
@@ -521,7 +617,7 @@ ${examples}
           error: response!.status === 429 ? 'API rate limit exceeded. Please wait a minute and try again.' : (text || 'Gemini request failed'),
         }), {
           status: response!.status === 429 ? 429 : 500,
-          headers: { ...corsHeaders, 'Content-Type': 'application/json' },
+          headers: jsonHeaders,
         })
       }
 
@@ -530,7 +626,7 @@ ${examples}
         const feedback = data?.promptFeedback || data?.blockReason || 'no candidates returned'
         return new Response(JSON.stringify({ error: 'AI returned empty response', details: feedback }), {
           status: 500,
-          headers: { ...corsHeaders, 'Content-Type': 'application/json' },
+          headers: jsonHeaders,
         })
       }
       const parts = data?.candidates?.[0]?.content?.parts || []
@@ -564,7 +660,7 @@ ${examples}
       if (!bulk || !Array.isArray(bulk.phases) || bulk.phases.length === 0) {
         return new Response(JSON.stringify({ error: 'Invalid AI response', raw: rawDebug }), {
           status: 500,
-          headers: { ...corsHeaders, 'Content-Type': 'application/json' },
+          headers: jsonHeaders,
         })
       }
     } else if (type === 'proposal') {
@@ -572,7 +668,7 @@ ${examples}
       if (!proposal || !proposal.content) {
         return new Response(JSON.stringify({ error: 'Invalid AI response', raw: rawDebug }), {
           status: 500,
-          headers: { ...corsHeaders, 'Content-Type': 'application/json' },
+          headers: jsonHeaders,
         })
       }
     } else if (type === 'blog') {
@@ -580,7 +676,7 @@ ${examples}
       if (!blog || !blog.title || !blog.content) {
         return new Response(JSON.stringify({ error: 'Invalid AI response', raw: rawDebug }), {
           status: 500,
-          headers: { ...corsHeaders, 'Content-Type': 'application/json' },
+          headers: jsonHeaders,
         })
       }
     } else if (type === 'weekly_summary') {
@@ -588,7 +684,7 @@ ${examples}
       if (!summary || !Array.isArray(summary.objectives) || !Array.isArray(summary.focus_tasks) || !Array.isArray(summary.recommendations)) {
         return new Response(JSON.stringify({ error: 'Invalid AI response', raw: rawDebug }), {
           status: 500,
-          headers: { ...corsHeaders, 'Content-Type': 'application/json' },
+          headers: jsonHeaders,
         })
       }
     } else if (type === 'advisor') {
@@ -596,7 +692,7 @@ ${examples}
       if (!advisor || !Array.isArray(advisor.insights)) {
         return new Response(JSON.stringify({ error: 'Invalid AI response', raw: rawDebug }), {
           status: 500,
-          headers: { ...corsHeaders, 'Content-Type': 'application/json' },
+          headers: jsonHeaders,
         })
       }
     } else if (type === 'plan_period') {
@@ -605,7 +701,7 @@ ${examples}
         console.error(`[gemini] plan_period validation failed. finishReason=${finishReason}, json is ${json === null ? 'null' : typeof json}, keys: ${json ? Object.keys(json).join(',') : 'N/A'}, rawDebug: ${rawDebug}`)
         return new Response(JSON.stringify({ error: 'Invalid AI response', finishReason, raw: rawDebug }), {
           status: 500,
-          headers: { ...corsHeaders, 'Content-Type': 'application/json' },
+          headers: jsonHeaders,
         })
       }
     } else if (type === 'standup') {
@@ -613,7 +709,7 @@ ${examples}
       if (!standup || !standup.summary || !Array.isArray(standup.actions)) {
         return new Response(JSON.stringify({ error: 'Invalid AI response', raw: rawDebug }), {
           status: 500,
-          headers: { ...corsHeaders, 'Content-Type': 'application/json' },
+          headers: jsonHeaders,
         })
       }
     } else if (type === 'advisor_chat') {
@@ -636,7 +732,7 @@ ${examples}
       if (!chat?.reply || typeof chat.reply !== 'string') {
         return new Response(JSON.stringify({ error: 'Invalid AI response', raw: rawDebug }), {
           status: 500,
-          headers: { ...corsHeaders, 'Content-Type': 'application/json' },
+          headers: jsonHeaders,
         })
       }
     } else if (type === 'finance_chat' || type === 'advisor_chat_actions' || type === 'comm_reply_compose') {
@@ -662,7 +758,7 @@ ${examples}
         console.error(`[gemini] ${type} validation failed. finishReason=${finishReason}, json keys: ${json ? Object.keys(json as object).join(',') : 'N/A'}, rawDebug: ${rawDebug?.slice(0, 500)}`)
         return new Response(JSON.stringify({ error: 'Invalid AI response', raw: rawDebug }), {
           status: 500,
-          headers: { ...corsHeaders, 'Content-Type': 'application/json' },
+          headers: jsonHeaders,
         })
       }
       if (chat.actions && !Array.isArray(chat.actions)) chat.actions = []
@@ -678,7 +774,7 @@ ${examples}
       ) {
         return new Response(JSON.stringify({ error: 'Invalid AI response', raw: rawDebug }), {
           status: 500,
-          headers: { ...corsHeaders, 'Content-Type': 'application/json' },
+          headers: jsonHeaders,
         })
       }
     } else if (type === 'finance_entries_batch') {
@@ -686,7 +782,7 @@ ${examples}
       if (!batch || !Array.isArray(batch.entries)) {
         return new Response(JSON.stringify({ error: 'Invalid AI response', raw: rawDebug }), {
           status: 500,
-          headers: { ...corsHeaders, 'Content-Type': 'application/json' },
+          headers: jsonHeaders,
         })
       }
     } else if (type === 'train_brand_style') {
@@ -695,7 +791,7 @@ ${examples}
       if (!out || typeof out.brand_prompt !== 'string' || out.brand_prompt.length < 50) {
         return new Response(JSON.stringify({ error: 'Invalid AI response — brand_prompt missing or too short', raw: rawDebug }), {
           status: 500,
-          headers: { ...corsHeaders, 'Content-Type': 'application/json' },
+          headers: jsonHeaders,
         })
       }
     } else if (type === 'generate_content') {
@@ -704,35 +800,35 @@ ${examples}
       if (!out || !Array.isArray(out.variations) || out.variations.length === 0) {
         return new Response(JSON.stringify({ error: 'Invalid AI response — variations[] missing', raw: rawDebug }), {
           status: 500,
-          headers: { ...corsHeaders, 'Content-Type': 'application/json' },
+          headers: jsonHeaders,
         })
       }
     } else if (type === 'generate_outreach') {
       const out = json as { body?: string; loom_script?: string }
       if (!out || typeof out.body !== 'string' || typeof out.loom_script !== 'string') {
         return new Response(JSON.stringify({ error: 'Invalid AI response — outreach missing body/loom_script', raw: rawDebug }), {
-          status: 500, headers: { ...corsHeaders, 'Content-Type': 'application/json' },
+          status: 500, headers: jsonHeaders,
         })
       }
     } else if (type === 'generate_case_study') {
       const out = json as { problem?: string; solution?: string; result?: string }
       if (!out || typeof out.problem !== 'string' || typeof out.solution !== 'string' || typeof out.result !== 'string') {
         return new Response(JSON.stringify({ error: 'Invalid AI response — case study missing problem/solution/result', raw: rawDebug }), {
-          status: 500, headers: { ...corsHeaders, 'Content-Type': 'application/json' },
+          status: 500, headers: jsonHeaders,
         })
       }
     } else if (type === 'suggest_content') {
       const out = json as { ideas?: unknown[] }
       if (!out || !Array.isArray(out.ideas) || out.ideas.length === 0) {
         return new Response(JSON.stringify({ error: 'Invalid AI response — ideas[] missing', raw: rawDebug }), {
-          status: 500, headers: { ...corsHeaders, 'Content-Type': 'application/json' },
+          status: 500, headers: jsonHeaders,
         })
       }
     } else if (type === 'ad_generator') {
       const out = json as { variations?: unknown[] }
       if (!out || !Array.isArray(out.variations) || out.variations.length === 0) {
         return new Response(JSON.stringify({ error: 'Invalid AI response — ad variations[] missing', raw: rawDebug }), {
-          status: 500, headers: { ...corsHeaders, 'Content-Type': 'application/json' },
+          status: 500, headers: jsonHeaders,
         })
       }
     } else if (type === 'comm_classify') {
@@ -748,7 +844,7 @@ ${examples}
           error: echoed ? 'AI echoed the input instead of classifying' : 'Invalid AI response — comm_classify missing intent/summary',
           raw: rawDebug,
         }), {
-          status: 500, headers: { ...corsHeaders, 'Content-Type': 'application/json' },
+          status: 500, headers: jsonHeaders,
         })
       }
     } else if (type === 'project_architect') {
@@ -756,13 +852,13 @@ ${examples}
       if (!out || typeof out.project !== 'object' || out.project === null || !Array.isArray(out.stages) || out.stages.length === 0) {
         return new Response(JSON.stringify({ error: 'Invalid AI response — project/stages missing', raw: rawDebug }), {
           status: 500,
-          headers: { ...corsHeaders, 'Content-Type': 'application/json' },
+          headers: jsonHeaders,
         })
       }
     } else if (!json || !(json as TaskResponse).title) {
       return new Response(JSON.stringify({ error: 'Invalid AI response', raw: rawDebug }), {
         status: 500,
-        headers: { ...corsHeaders, 'Content-Type': 'application/json' },
+        headers: jsonHeaders,
       })
     }
 
@@ -809,12 +905,12 @@ ${examples}
     }
 
     return new Response(JSON.stringify({ result: json, output_id: outputId }), {
-      headers: { ...corsHeaders, 'Content-Type': 'application/json' },
+      headers: jsonHeaders,
     })
   } catch (err) {
     return new Response(JSON.stringify({ error: String(err) }), {
       status: 500,
-      headers: { ...corsHeaders, 'Content-Type': 'application/json' },
+      headers: jsonHeaders,
     })
   }
 })
@@ -57,7 +57,23 @@ Discipline:
 - Respond in the SAME language as the user's question.
 `;
 
+const FALLBACK_SYSTEM_PROMPT = 'You are a helpful assistant. Return ONLY valid JSON.'
+
+// Prompts are pure functions of `type`; compose each one once per isolate.
+// Unknown types (caller-controlled) get the fallback and are not cached,
+// so the map stays bounded by the registry above.
+const systemPromptCache = new Map<string, string>()
+
 export function buildSystemPrompt(type: string): string {
+  let prompt = systemPromptCache.get(type)
+  if (prompt === undefined) {
+    prompt = composeSystemPrompt(type)
+    if (prompt !== FALLBACK_SYSTEM_PROMPT) systemPromptCache.set(type, prompt)
+  }
+  return prompt
+}
+
+function composeSystemPrompt(type: string): string {
   return (
   type === 'task'
         ? `You are a task creation assistant. Return ONLY valid JSON with keys: title (string), priority (low|medium|high|urgent), tag (string).
@@ -1064,6 +1080,6 @@ Rules:
 - visual_brief: only when content_type implies media (reel, post with image, ad). For pure text formats, omit or set null.
 - Respond in the brand's primary language (infer from brand_prompt). Default English.
 - No markdown fences. Plain JSON only.`
-        : 'You are a helpful assistant. Return ONLY valid JSON.'
+        : FALLBACK_SYSTEM_PROMPT
   )
 }
@@ -46,7 +46,8 @@
 //      so the gmail-watch function calls users.watch and stores the
 //      starting historyId.
 
-import { createClient, SupabaseClient } from 'https://esm.sh/@supabase/supabase-js@2'
+import type { SupabaseClient } from 'https://esm.sh/@supabase/supabase-js@2'
+import { adminClient } from '../_shared/comm-utils.ts'
 
 const corsHeaders = {
   'Access-Control-Allow-Origin': '*',
@@ -61,11 +62,6 @@ const AUDIENCE_TOKEN = Deno.env.get('GMAIL_PUBSUB_AUDIENCE_TOKEN') || ''
 const GOOGLE_CLIENT_ID = Deno.env.get('GOOGLE_CLIENT_ID')!
 const GOOGLE_CLIENT_SECRET = Deno.env.get('GOOGLE_CLIENT_SECRET')!
 
-const adminClient = (): SupabaseClient =>
-  createClient(SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY, {
-    auth: { persistSession: false, autoRefreshToken: false },
-  })
-
 interface PubSubPushBody {
   message?: { data?: string; messageId?: string; publishTime?: string }
   subscription?: string
@@ -99,7 +95,10 @@ const decodeB64Url = (data: string): string => {
   const norm = data.replace(/-/g, '+').replace(/_/g, '/')
   const pad = '='.repeat((4 - (norm.length % 4)) % 4)
   try {
-    return new TextDecoder().decode(Uint8Array.from(atob(norm + pad), c => c.charCodeAt(0)))
+    const binary = atob(norm + pad)
+    const bytes = new Uint8Array(binary.length)
+    for (let i = 0; i < binary.length; i++) bytes[i] = binary.charCodeAt(i)
+    return new TextDecoder().decode(bytes)
   } catch { return '' }
 }
 
@@ -110,10 +109,11 @@ const extractBodies = (payload: GmailMessagePayload['payload']): { text: string;
     if (!part) return
     const mime = (part.mimeType || '').toLowerCase()
     const data = part.body?.data
+    // Only the first text/plain and text/html parts are kept, so other
+    // parts (inline images, calendar blobs, duplicates) are never decoded.
     if (data) {
-      const decoded = decodeB64Url(data)
-      if (mime === 'text/plain' && !text) text = decoded
-      else if (mime === 'text/html' && !html) html = decoded
+      if (mime === 'text/plain' && !text) text = decodeB64Url(data)
+      else if (mime === 'text/html' && !html) html = decodeB64Url(data)
     }
     if (Array.isArray(part.parts)) part.parts.forEach(walk)
   }
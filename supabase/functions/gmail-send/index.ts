@@ -49,10 +49,17 @@ function buildRfc2822(args: {
   return lines.join('\r\n')
 }
 
+// Bytes → binary string in 32KB slices: one fromCharCode call per slice
+// rather than a string append per byte of the message. Slices stay well
+// under the engine's argument-count limit.
+const B64_SLICE = 0x8000
+
 const b64url = (str: string): string => {
   const bytes = new TextEncoder().encode(str)
   let binary = ''
-  for (const b of bytes) binary += String.fromCharCode(b)
+  for (let i = 0; i < bytes.length; i += B64_SLICE) {
+    binary += String.fromCharCode.apply(null, bytes.subarray(i, i + B64_SLICE) as unknown as number[])
+  }
   return btoa(binary).replace(/\+/g, '-').replace(/\//g, '_').replace(/=+$/, '')
 }
 
@@ -39,7 +39,10 @@ const decodeB64Url = (data: string): string => {
   const norm = data.replace(/-/g, '+').replace(/_/g, '/')
   const pad = '='.repeat((4 - (norm.length % 4)) % 4)
   try {
-    return new TextDecoder().decode(Uint8Array.from(atob(norm + pad), c => c.charCodeAt(0)))
+    const binary = atob(norm + pad)
+    const bytes = new Uint8Array(binary.length)
+    for (let i = 0; i < binary.length; i++) bytes[i] = binary.charCodeAt(i)
+    return new TextDecoder().decode(bytes)
   } catch {
     return ''
   }
@@ -53,10 +56,11 @@ const extractBodies = (payload: GmailMessagePayload['payload']): { text: string;
     if (!part) return
     const mime = (part.mimeType || '').toLowerCase()
     const data = part.body?.data
+    // Decode lazily: attachments and inline images can carry large
+    // body.data payloads we would only throw away.
     if (data) {
-      const decoded = decodeB64Url(data)
-      if (mime === 'text/plain' && !text) text = decoded
-      else if (mime === 'text/html' && !html) html = decoded
+      if (mime === 'text/plain' && !text) text = decodeB64Url(data)
+      else if (mime === 'text/html' && !html) html = decodeB64Url(data)
     }
     if (Array.isArray(part.parts)) part.parts.forEach(walk)
   }
@@ -24,7 +24,7 @@
 // verify_jwt=true — solo users autenticados con tenant válido pueden pedir digest.
 
 import { serve } from 'https://deno.land/std@0.224.0/http/server.ts'
-import { createClient } from 'https://esm.sh/@supabase/supabase-js@2'
+import { adminClient } from '../_shared/comm-utils.ts'
 
 const cors = {
   'Access-Control-Allow-Origin': '*',
@@ -68,12 +68,6 @@ Rules:
 - Language: detect from message bodies and match (es/en).
 - Be concise. No markdown. No filler ("here's the digest").`
 
-function adminClient() {
-  return createClient(SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY, {
-    auth: { persistSession: false, autoRefreshToken: false },
-  })
-}
-
 function normalizeEmailSubject(subject: string | null | undefined): string {
   return (subject || '').replace(/^(\s*(re|fw|fwd)\s*:\s*)+/i, '').trim().toLowerCase()
 }
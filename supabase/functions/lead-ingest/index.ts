@@ -10,10 +10,11 @@ const corsHeaders = {
   'Access-Control-Allow-Methods': 'POST, OPTIONS'
 }
 
-const detectLanguage = (text: string) => {
-  const spanishHints = /(\b(el|la|los|las|que|para|con|una|este|esta|cliente|propuesta|entregables)\b)/i
-  return spanishHints.test(text) ? 'es' : 'en'
-}
+// Compiled once per isolate — a single case-insensitive scan per call.
+const SPANISH_HINTS = /\b(?:el|la|los|las|que|para|con|una|este|esta|cliente|propuesta|entregables)\b/i
+
+const detectLanguage = (text: string) =>
+  SPANISH_HINTS.test(text) ? 'es' : 'en'
 
 const LEAD_VALUE_BY_CATEGORY: Record<string, number> = {
   contact: 500,
@@ -33,6 +33,13 @@ Return ONLY JSON:
   "owners_suggested":{}, "suggested_dates":{}, "risks":[ {"type","description","stage"} ], "missing_info":[], "custom_notes":[] }
 Keep every "ref" unique so dependencies resolve.`;
 
+// Lazily created once per isolate; see aurora-chat for the same pattern.
+let openaiClient: OpenAI | null = null;
+function getOpenAI(apiKey: string): OpenAI {
+  if (!openaiClient) openaiClient = new OpenAI({ apiKey });
+  return openaiClient;
+}
+
 serve(async (req: Request) => {
   if (req.method === 'OPTIONS') return new Response('ok', { headers: corsHeaders });
   if (req.method !== 'POST') return json({ ok: false, error: 'method_not_allowed' }, 405);
@@ -95,7 +102,7 @@ serve(async (req: Request) => {
     '', 'Generate the onboarding plan JSON now. Respect scope strictly.',
   ].join('\n');
 
-  const openai = new OpenAI({ apiKey: openaiKey });
+  const openai = getOpenAI(openaiKey);
   let plan: any = null;
   try {
     const res = await openai.chat.completions.create({
@@ -39,6 +39,23 @@ function parseMoney(v: unknown): number | null {
   return Number.isFinite(n) ? n : null;
 }
 
+// Module-level so warm isolates keep the client's pooled connections.
+let openaiClient: OpenAI | null = null;
+function getOpenAI(apiKey: string): OpenAI {
+  if (!openaiClient) openaiClient = new OpenAI({ apiKey });
+  return openaiClient;
+}
+
+let supabaseAdminClient: ReturnType<typeof createClient> | null = null;
+function getSupabaseAdmin(url: string, serviceKey: string) {
+  if (!supabaseAdminClient) {
+    supabaseAdminClient = createClient(url, serviceKey, {
+      auth: { autoRefreshToken: false, persistSession: false },
+    });
+  }
+  return supabaseAdminClient;
+}
+
 serve(async (req: Request) => {
   if (req.method === 'OPTIONS') return new Response('ok', { headers: corsHeaders });
   if (req.method !== 'POST') return json({ ok: false, error: 'method_not_allowed' }, 405);
@@ -56,9 +73,7 @@ serve(async (req: Request) => {
     global: { headers: { Authorization: `Bearer ${jwt}` } },
     auth: { autoRefreshToken: false, persistSession: false },
   });
-  const supabaseAdmin = createClient(supabaseUrl, supabaseServiceKey, {
-    auth: { autoRefreshToken: false, persistSession: false },
-  });
+  const supabaseAdmin = getSupabaseAdmin(supabaseUrl, supabaseServiceKey);
 
   const { data: { user } } = await supabase.auth.getUser();
   if (!user) return json({ ok: false, error: 'invalid_jwt' }, 401);
@@ -75,7 +90,7 @@ serve(async (req: Request) => {
   const market = body.market === 'latam' ? 'latam' : 'us';
   const isExisting = !!body.isExistingClient;
 
-  const openai = new OpenAI({ apiKey: openaiKey });
+  const openai = getOpenAI(openaiKey);
 
   // 1) live catalog (RLS-scoped)
   const { data: catalog } = await supabase
@@ -87,9 +102,10 @@ serve(async (req: Request) => {
 
   // 2) semantic recall of past work
   let similar: any[] = [];
+  let queryEmbedding: number[] | null = null;
   try {
     const emb = await openai.embeddings.create({ model: EMBED_MODEL, input: briefText.slice(0, 8000) });
-    const queryEmbedding = emb.data[0].embedding;
+    queryEmbedding = emb.data[0].embedding;
     const { data: matches } = await supabase.rpc('match_ai_outputs', {
       p_tenant_id: tenantId,
       p_query_embedding: queryEmbedding,
@@ -139,9 +155,13 @@ serve(async (req: Request) => {
       ? { mode: 'two_option', simple: { items: quote.options.simple?.items || [], totals: sum(quote.options.simple?.items) }, premium: { items: quote.options.premium?.items || [], totals: sum(quote.options.premium?.items) } }
       : { mode: 'single', single: { items: quote?.line_items || [], totals: sum(quote?.line_items) } };
 
-  // best-effort: log this generation + embedding so future quotes can recall it
+  // best-effort: log this generation + embedding so future quotes can recall it.
+  // Same brief text as the recall step, so its embedding is reused.
   try {
-    const emb2 = await openai.embeddings.create({ model: EMBED_MODEL, input: briefText.slice(0, 8000) });
+    if (!queryEmbedding) {
+      const emb = await openai.embeddings.create({ model: EMBED_MODEL, input: briefText.slice(0, 8000) });
+      queryEmbedding = emb.data[0].embedding;
+    }
     await supabaseAdmin.from('ai_output_log').insert({
       tenant_id: tenantId,
       user_id: user.id,
@@ -149,7 +169,7 @@ serve(async (req: Request) => {
       input_text: briefText.slice(0, 4000),
       input_hash: crypto.randomUUID(),
       output_json: quote,
-      embedding: emb2.data[0].embedding,
+      embedding: queryEmbedding,
     });
   } catch (_e) { /* logging is best-effort */ }
 
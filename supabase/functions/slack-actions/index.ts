@@ -19,7 +19,8 @@
 // verify_jwt=false porque Slack no manda JWT.
 
 import { serve } from 'https://deno.land/std@0.224.0/http/server.ts'
-import { createClient, SupabaseClient } from 'https://esm.sh/@supabase/supabase-js@2'
+import type { SupabaseClient } from 'https://esm.sh/@supabase/supabase-js@2'
+import { adminClient } from '../_shared/comm-utils.ts'
 
 const cors = {
   'Access-Control-Allow-Origin': '*',
@@ -31,12 +32,6 @@ const SUPABASE_URL = Deno.env.get('SUPABASE_URL')!
 const SUPABASE_SERVICE_ROLE_KEY = Deno.env.get('SUPABASE_SERVICE_ROLE_KEY')!
 const SLACK_SIGNING_SECRET = Deno.env.get('SLACK_SIGNING_SECRET') || ''
 
-function adminClient(): SupabaseClient {
-  return createClient(SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY, {
-    auth: { persistSession: false, autoRefreshToken: false },
-  })
-}
-
 // HMAC verification — same impl as slack-events.
 async function verifySlackSignature(rawBody: string, timestamp: string, signature: string): Promise<boolean> {
   if (!SLACK_SIGNING_SECRET) return false
@@ -19,7 +19,8 @@
 // verify_jwt=false porque lo invoca el trigger Postgres o slack-events.
 
 import { serve } from 'https://deno.land/std@0.224.0/http/server.ts'
-import { createClient, SupabaseClient } from 'https://esm.sh/@supabase/supabase-js@2'
+import type { SupabaseClient } from 'https://esm.sh/@supabase/supabase-js@2'
+import { adminClient } from '../_shared/comm-utils.ts'
 
 const cors = {
   'Access-Control-Allow-Origin': '*',
@@ -101,12 +102,6 @@ const TOOLS = [
   },
 ]
 
-function adminClient(): SupabaseClient {
-  return createClient(SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY, {
-    auth: { persistSession: false, autoRefreshToken: false },
-  })
-}
-
 async function slackFetch<T = any>(botToken: string, method: string, payload: any, isPost = true): Promise<T> {
   const url = `https://slack.com/api/${method}`
   const opts: any = {
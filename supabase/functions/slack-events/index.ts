@@ -25,7 +25,8 @@
 //   - classify_and_propose         → inserta + corre gemini + propone (sin auto-task).
 //   - classify_and_auto_create     → inserta + corre gemini + crea task si confidence>0.85.
 
-import { createClient, SupabaseClient } from 'https://esm.sh/@supabase/supabase-js@2'
+import type { SupabaseClient } from 'https://esm.sh/@supabase/supabase-js@2'
+import { adminClient } from '../_shared/comm-utils.ts'
 
 const corsHeaders = {
   'Access-Control-Allow-Origin': '*',
@@ -39,11 +40,6 @@ const SLACK_SIGNING_SECRET = Deno.env.get('SLACK_SIGNING_SECRET') || ''
 
 const COMPLETION_REACTIONS = new Set(['white_check_mark', 'check', 'ballot_box_with_check', 'heavy_check_mark'])
 
-const adminClient = (): SupabaseClient =>
-  createClient(SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY, {
-    auth: { persistSession: false, autoRefreshToken: false },
-  })
-
 interface SlackUser {
   id: string
   name?: string
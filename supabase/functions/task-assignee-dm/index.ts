@@ -20,7 +20,8 @@
 // verify_jwt=false porque lo invoca el trigger Postgres.
 
 import { serve } from 'https://deno.land/std@0.224.0/http/server.ts'
-import { createClient, SupabaseClient } from 'https://esm.sh/@supabase/supabase-js@2'
+import type { SupabaseClient } from 'https://esm.sh/@supabase/supabase-js@2'
+import { adminClient } from '../_shared/comm-utils.ts'
 
 const cors = {
   'Access-Control-Allow-Origin': '*',
@@ -32,12 +33,6 @@ const SUPABASE_URL = Deno.env.get('SUPABASE_URL')!
 const SUPABASE_SERVICE_ROLE_KEY = Deno.env.get('SUPABASE_SERVICE_ROLE_KEY')!
 const APP_URL = Deno.env.get('APP_URL') || 'https://app.livv.systems'
 
-function adminClient(): SupabaseClient {
-  return createClient(SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY, {
-    auth: { persistSession: false, autoRefreshToken: false },
-  })
-}
-
 async function slackPost(botToken: string, payload: any): Promise<any> {
   const res = await fetch('https://slack.com/api/chat.postMessage', {
     method: 'POST',
@@ -0,0 +1,67 @@
+import { describe, it, expect } from 'vitest';
+import { __routingForTests } from '../lib/agents/orchestrator';
+import type { ActiveOverride } from '../lib/agents/overrides';
+
+const { foldText, scoreAgent, routeAgent } = __routingForTests;
+
+const route = (query: string, overrides?: Map<string, ActiveOverride>) =>
+  routeAgent(foldText(query), overrides).id;
+
+const override = (agentId: string, patch: Partial<ActiveOverride>): Map<string, ActiveOverride> =>
+  new Map([[agentId, {
+    id: `ovr-${agentId}`,
+    tenant_id: 'tenant-1',
+    agent_id: agentId,
+    routing_hints_add: [],
+    routing_hints_remove: [],
+    prompt_suffix: null,
+    skill_overrides: {},
+    disabled_skills: [],
+    ...patch,
+  }]]);
+
+describe('foldText', () => {
+  it('lower-cases and strips diacritics', () => {
+    expect(foldText('Facturación de MAÑANA')).toBe('facturacion de manana');
+  });
+});
+
+describe('routeAgent — accent-insensitive Spanish routing', () => {
+  it.each([
+    ['¿Cuánto llevo de facturación este mes?', 'finance-agent'],
+    ['cuanto llevo de facturacion este mes', 'finance-agent'],
+    ['Agendá una reunión para mañana', 'calendar-agent'],
+    ['agenda una reunion para manana', 'calendar-agent'],
+    ['¿Quién es el cliente Acme?', 'clients-agent'],
+    ['quien es el cliente acme', 'clients-agent'],
+  ])('%s → %s', (query, agentId) => {
+    expect(route(query)).toBe(agentId);
+  });
+
+  it('scores accented and unaccented spellings the same', () => {
+    const finance = routeAgent(foldText('facturación'));
+    expect(scoreAgent(finance, foldText('Facturación pendiente')))
+      .toBe(scoreAgent(finance, foldText('facturacion pendiente')));
+  });
+
+  it('sends long pasted content with no strong match to onboarding', () => {
+    expect(route('Lorem ipsum dolor sit amet, consectetur adipiscing elit. '.repeat(15))).toBe('onboarding-agent');
+  });
+});
+
+describe('routeAgent — tenant override hints', () => {
+  it('promotes an agent through an added hint, folded like the defaults', () => {
+    // No default hint matches, so routing falls back to the first agent.
+    expect(route('mandame la licitacion del mes')).toBe('tasks-agent');
+    const overrides = override('finance-agent', { routing_hints_add: ['Licitación'] });
+    expect(route('mandame la licitacion del mes', overrides)).toBe('finance-agent');
+    expect(route('mandame la licitación del mes', overrides)).toBe('finance-agent');
+  });
+
+  it('demotes an agent through a removed hint', () => {
+    // 'pending' is a default hint for both tasks and finance; tasks wins the tie.
+    expect(route('show pending items')).toBe('tasks-agent');
+    const overrides = override('tasks-agent', { routing_hints_remove: ['pending'] });
+    expect(route('show pending items', overrides)).toBe('finance-agent');
+  });
+});
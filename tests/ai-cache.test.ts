@@ -0,0 +1,115 @@
+import { describe, it, expect, beforeEach, vi } from 'vitest';
+
+type AIModule = typeof import('../lib/ai');
+
+// The memory layer is module state — load a fresh copy of lib/ai per test.
+let ai: AIModule;
+let cache: AIModule['__aiCacheForTests'];
+
+const aiKeys = (): string[] =>
+  Array.from({ length: localStorage.length }, (_, i) => localStorage.key(i) as string)
+    .filter(k => k.startsWith('ai_v2:'));
+
+// Serializes to well over the 30KB per-entry localStorage limit.
+const oversized = () => ({ insights: [{ id: 'big', body: 'x'.repeat(40_000) }] });
+
+beforeEach(async () => {
+  localStorage.clear();
+  vi.resetModules();
+  ai = await import('../lib/ai');
+  cache = ai.__aiCacheForTests;
+});
+
+describe('AI cache — memory layer', () => {
+  it('hands every hit an isolated copy', () => {
+    const result = { insights: [{ id: 'a', title: 'Cobrar factura' }] };
+    cache.setCache('advisor', 'ctx', result);
+    result.insights.push({ id: 'late', title: 'mutated after caching' });
+
+    const first = cache.getCached<typeof result>('advisor', 'ctx')!;
+    first.insights[0].title = 'mutated by a consumer';
+    first.insights.length = 0;
+
+    const second = cache.getCached<typeof result>('advisor', 'ctx');
+    expect(second).toEqual({ insights: [{ id: 'a', title: 'Cobrar factura' }] });
+    expect(second).not.toBe(first);
+  });
+
+  it('serves hits from memory without re-reading localStorage', () => {
+    cache.setCache('advisor', 'ctx', { insights: [] });
+    expect(aiKeys()).toHaveLength(1);
+    localStorage.removeItem(aiKeys()[0]);
+    expect(cache.getCached('advisor', 'ctx')).toEqual({ insights: [] });
+  });
+
+  it('keeps serving entries skipped for localStorage size from memory', () => {
+    cache.setCache('advisor', 'big', oversized());
+    expect(aiKeys()).toHaveLength(0);
+    expect(cache.getCached('advisor', 'big')).toEqual(oversized());
+  });
+
+  it('does not cache types with a zero TTL', () => {
+    cache.setCache('advisor_chat', 'ctx', { reply: 'hola' });
+    expect(cache.getCached('advisor_chat', 'ctx')).toBeNull();
+    expect(aiKeys()).toHaveLength(0);
+  });
+
+  it('clearAICache empties the memory layer for that type only', () => {
+    cache.setCache('advisor', 'big', oversized());
+    cache.setCache('blog', 'big', oversized());
+    ai.clearAICache('advisor');
+    expect(cache.getCached('advisor', 'big')).toBeNull();
+    expect(cache.getCached('blog', 'big')).not.toBeNull();
+    ai.clearAICache();
+    expect(cache.getCached('blog', 'big')).toBeNull();
+  });
+
+  it('purgeAllAICache empties the memory layer too', () => {
+    cache.setCache('advisor', 'small', { insights: [] });
+    cache.setCache('advisor', 'big', oversized());
+    cache.purgeAllAICache();
+    expect(aiKeys()).toHaveLength(0);
+    expect(cache.getCached('advisor', 'small')).toBeNull();
+    expect(cache.getCached('advisor', 'big')).toBeNull();
+  });
+
+  it('drops the memory copy of a key another tab removed', () => {
+    cache.setCache('advisor', 'ctx', { insights: [] });
+    const [key] = aiKeys();
+    // Simulate the other tab's write: the storage event never fires in the writing tab.
+    localStorage.removeItem(key);
+    window.dispatchEvent(new StorageEvent('storage', { key }));
+    expect(cache.getCached('advisor', 'ctx')).toBeNull();
+  });
+
+  it('drops every memory copy when another tab clears the storage', () => {
+    cache.setCache('advisor', 'big', oversized());
+    window.dispatchEvent(new StorageEvent('storage', { key: null }));
+    expect(cache.getCached('advisor', 'big')).toBeNull();
+  });
+});
+
+describe('AI cache — readEntryTimestamp', () => {
+  it('reads the age off the prefix of timestamp-first entries', () => {
+    const raw = JSON.stringify({ timestamp: 1750334400000, result: { insights: [] } });
+    expect(cache.readEntryTimestamp(raw)).toBe(1750334400000);
+  });
+
+  it('does not parse the body of timestamp-first entries', () => {
+    // Truncated JSON would throw if it were parsed — the prefix is enough.
+    expect(cache.readEntryTimestamp('{"timestamp":1750334400000,"result":{"insi')).toBe(1750334400000);
+  });
+
+  it('falls back to a full parse for entries written result-first', () => {
+    const raw = JSON.stringify({ result: { insights: [] }, timestamp: 1750334400000 });
+    expect(cache.readEntryTimestamp(raw)).toBe(1750334400000);
+  });
+
+  it('treats an old-format entry without a timestamp as oldest', () => {
+    expect(cache.readEntryTimestamp(JSON.stringify({ result: {} }))).toBe(0);
+  });
+
+  it('throws on corrupted entries so callers can evict them', () => {
+    expect(() => cache.readEntryTimestamp('not json')).toThrow();
+  });
+});
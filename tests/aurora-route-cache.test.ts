@@ -0,0 +1,109 @@
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
+
+type RouteCacheModule = typeof import('../supabase/functions/aurora-chat/route-cache');
+
+// The cache is module state shared by the whole isolate — load a fresh copy
+// per test so entries don't leak between cases.
+let cache: RouteCacheModule;
+
+const result = (canvas: any, text = 'Te paso con Marina, que lleva el cashflow del tenant.') => ({
+  text,
+  canvas,
+  tokens_in: 120,
+  tokens_out: 30,
+  tokens_cached: 0,
+  model: 'gpt-4o-mini',
+  cost_usd: 0.0001,
+  trace: [],
+});
+
+const route = (target: string, reason = 'preguntó por su cashflow') =>
+  result({ type: 'route', target_agent: target, reason });
+
+beforeEach(async () => {
+  vi.resetModules();
+  vi.useFakeTimers();
+  vi.setSystemTime(new Date('2026-06-19T12:00:00Z'));
+  cache = await import('../supabase/functions/aurora-chat/route-cache');
+});
+
+afterEach(() => {
+  vi.useRealTimers();
+});
+
+describe('normalizeUtterance', () => {
+  it('lower-cases, strips accents and edge punctuation, collapses whitespace', () => {
+    expect(cache.normalizeUtterance('  ¿Cómo   viene el CASHFLOW?  ')).toBe('como viene el cashflow');
+    expect(cache.normalizeUtterance('¡Facturación pendiente!!')).toBe('facturacion pendiente');
+  });
+
+  it('maps accented and unaccented spellings to the same key', () => {
+    expect(cache.normalizeUtterance('cómo viene la facturación'))
+      .toBe(cache.normalizeUtterance('como viene la facturacion'));
+  });
+});
+
+describe('smallTalkReply', () => {
+  it('answers bare greetings and thanks without a canvas', () => {
+    const hola = cache.smallTalkReply('¡Hola Atlas!');
+    expect(hola?.canvas).toBeNull();
+    expect(hola?.model).toBe('small-talk');
+    expect(cache.smallTalkReply('muchas gracias')?.text).toMatch(/^De nada/);
+  });
+
+  it('lets real questions through to the model', () => {
+    expect(cache.smallTalkReply('hola, cómo viene el cashflow')).toBeNull();
+  });
+});
+
+describe('route cache', () => {
+  it('serves a remembered route for the same normalized utterance', () => {
+    cache.rememberRoute('¿Cómo viene el cashflow?', route('marina'));
+    const hit = cache.getCachedRoute('como viene el cashflow');
+    expect(hit?.canvas).toEqual({ type: 'route', target_agent: 'marina' });
+    expect(hit?.model).toBe('route-cache');
+    expect(hit?.cost_usd).toBe(0);
+    expect(hit?.tokens_in).toBe(0);
+  });
+
+  it('rebuilds the reply from the target instead of replaying the stored text/reason', () => {
+    cache.rememberRoute('como viene el cashflow', route('marina'));
+    const hit = cache.getCachedRoute('como viene el cashflow');
+    expect(hit?.text).toBe('Te derivo a marina.');
+    expect(hit?.canvas.reason).toBeUndefined();
+  });
+
+  it('never caches utterances shorter than three words', () => {
+    cache.rememberRoute('el primero', route('marina'));
+    cache.rememberRoute('sí', route('marina'));
+    expect(cache.getCachedRoute('el primero')).toBeNull();
+    expect(cache.getCachedRoute('sí')).toBeNull();
+  });
+
+  it('does not cache routes to pulse', () => {
+    cache.rememberRoute('como viene el equipo', route('pulse'));
+    expect(cache.getCachedRoute('como viene el equipo')).toBeNull();
+  });
+
+  it('does not cache text replies', () => {
+    cache.rememberRoute('necesito ayuda con algo', result(null, '¿Sobre qué tema?'));
+    expect(cache.getCachedRoute('necesito ayuda con algo')).toBeNull();
+  });
+
+  it('expires entries after an hour', () => {
+    cache.rememberRoute('como viene el cashflow', route('marina'));
+    vi.advanceTimersByTime(59 * 60 * 1000);
+    expect(cache.getCachedRoute('como viene el cashflow')).not.toBeNull();
+    vi.advanceTimersByTime(2 * 60 * 1000);
+    expect(cache.getCachedRoute('como viene el cashflow')).toBeNull();
+  });
+
+  it('evicts the oldest entry once 500 routes are cached', () => {
+    for (let i = 0; i < 500; i++) cache.rememberRoute(`consulta numero ${i}`, route('marina'));
+    expect(cache.getCachedRoute('consulta numero 0')).not.toBeNull();
+    cache.rememberRoute('una consulta nueva', route('nova'));
+    expect(cache.getCachedRoute('consulta numero 0')).toBeNull();
+    expect(cache.getCachedRoute('consulta numero 1')).not.toBeNull();
+    expect(cache.getCachedRoute('una consulta nueva')?.canvas.target_agent).toBe('nova');
+  });
+});